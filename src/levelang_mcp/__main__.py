@@ -7,6 +7,7 @@ Usage:
 from __future__ import annotations
 
 import logging
+import sys
 
 import anyio
 
@@ -19,11 +20,21 @@ from .server import levelang, mcp, settings
 
 logger = logging.getLogger("levelang_mcp.server")
 
+# uvloop is POSIX-only; elsewhere fall back to the stock asyncio loop.
+_USE_UVLOOP = sys.platform != "win32"
+
+
+# Log format chosen for ``"auto"`` per transport; anything else gets text.
+_AUTO_LOG_FORMATS: dict[str, str] = {
+    "streamable-http": "json",
+    "stdio": "text",
+}
+
 
 def _resolve_log_format(raw: str, transport: str) -> str:
     """Resolve ``"auto"`` to a concrete format based on transport."""
     if raw == "auto":
-        return "json" if transport == "streamable-http" else "text"
+        return _AUTO_LOG_FORMATS.get(transport, "text")
     return raw
 
 
@@ -51,6 +62,14 @@ async def _run_streamable_http() -> None:
         access_log=False,
         # Don't advertise the server implementation in response headers.
         server_header=False,
+        # C-accelerated HTTP parser.  The event loop is already uvloop (set
+        # via anyio.run in main), so uvicorn's ``loop`` option doesn't apply.
+        http="httptools",
+        # MCP streamable-http doesn't use websockets — skip loading them.
+        ws="none",
+        # The MCP app needs its lifespan to start the session manager;
+        # fail fast if it doesn't run.
+        lifespan="on",
         # Keep-alive timeout — how long to keep idle connections open.
         # MCP clients may hold long-lived connections; 120s is generous
         # without being wasteful.
@@ -78,7 +97,7 @@ def main() -> None:
     logger.info("Starting Levelang MCP server (transport=%s)", transport)
 
     if transport == "streamable-http":
-        anyio.run(_run_streamable_http)
+        anyio.run(_run_streamable_http, backend_options={"use_uvloop": _USE_UVLOOP})
     else:
         try:
             mcp.run(transport="stdio")
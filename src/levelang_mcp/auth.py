@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 import logging
+import operator
+
+from collections.abc import Callable
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
 logger = logging.getLogger("levelang_mcp.auth")
@@ -14,13 +18,38 @@ logger = logging.getLogger("levelang_mcp.auth")
 # Paths that bypass authentication (e.g. health checks for load balancers).
 _PUBLIC_PATHS: frozenset[str] = frozenset({"/health"})
 
+# Pre-serialized 401 bodies — the middleware never builds Response objects.
+_MISSING_HEADER_BODY = b'{"error":"Missing Authorization header"}'
+_MALFORMED_HEADER_BODY = (
+    b'{"error":"Invalid Authorization header format, expected \'Bearer <key>\'"}'
+)
+_INVALID_KEY_BODY = b'{"error":"Invalid API key"}'
+
+# Health probes hit this at a steady rate; serialize the body only once.
+_HEALTH_BODY = b'{"status":"ok"}'
+
 
-async def health_endpoint(request: Request) -> JSONResponse:
+async def health_endpoint(request: Request) -> Response:
     """Unauthenticated health-check endpoint for load balancers."""
-    return JSONResponse({"status": "ok"})
+    return Response(_HEALTH_BODY, media_type="application/json")
+
+
+async def _send_unauthorized(send: Send, body: bytes) -> None:
+    """Emit a 401 JSON response directly over the ASGI ``send`` channel."""
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 401,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
 
 
-class APIKeyAuthMiddleware(BaseHTTPMiddleware):
+class APIKeyAuthMiddleware:
     """Validate ``Authorization: Bearer <key>`` against a set of known keys.
 
     When *valid_keys* is empty, every request is allowed through (auth
@@ -28,56 +57,61 @@ class APIKeyAuthMiddleware(BaseHTTPMiddleware):
 
     Requests to paths in ``_PUBLIC_PATHS`` (e.g. ``/health``) are always
     allowed through regardless of auth configuration.
+
+    Implemented as a pure ASGI middleware: the header is read straight from
+    the connection scope, so no ``Request``/``Response`` objects are built
+    and the response body is never buffered on the way out.
     """
 
-    def __init__(self, app: object, valid_keys: frozenset[str]) -> None:
-        super().__init__(app)  # type: ignore[arg-type]
+    def __init__(self, app: ASGIApp, valid_keys: frozenset[str]) -> None:
+        self.app = app
         self.valid_keys = valid_keys
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        # Public paths bypass auth entirely.
-        if request.url.path in _PUBLIC_PATHS:
-            return await call_next(request)
-
-        # Auth disabled — pass everything through.
-        if not self.valid_keys:
-            return await call_next(request)
-
-        client_ip = request.client.host if request.client else "unknown"
-        auth_header = request.headers.get("Authorization")
-
+        # Full header values that authenticate, so the success path is a
+        # single check on the raw header bytes.  Single-key deployments (the
+        # common case) compare bytes directly instead of hashing into a set.
+        valid_headers = frozenset(f"Bearer {k}".encode() for k in valid_keys)
+        self._is_valid_header: Callable[[bytes | None], bool]
+        if len(valid_headers) == 1:
+            self._is_valid_header = functools.partial(operator.eq, *valid_headers)
+        else:
+            self._is_valid_header = valid_headers.__contains__
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Lifespan and websocket scopes are none of our business.
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Public paths bypass auth entirely; auth disabled passes everything.
+        if scope["path"] in _PUBLIC_PATHS or not self.valid_keys:
+            await self.app(scope, receive, send)
+            return
+
+        auth_header: bytes | None = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                auth_header = value
+                break
+
+        if self._is_valid_header(auth_header):
+            await self.app(scope, receive, send)
+            return
+
+        # Slow path: classify the failure for a precise error message.
         if not auth_header:
-            logger.warning(
-                "Auth failed: missing Authorization header (client=%s)", client_ip
-            )
-            return JSONResponse(
-                {"error": "Missing Authorization header"},
-                status_code=401,
-            )
-
-        # Expect "Bearer <key>"
-        parts = auth_header.split(" ", maxsplit=1)
-        if len(parts) != 2 or parts[0] != "Bearer":
-            logger.warning(
-                "Auth failed: malformed Authorization header (client=%s)", client_ip
-            )
-            return JSONResponse(
-                {
-                    "error": "Invalid Authorization header format, expected 'Bearer <key>'"
-                },
-                status_code=401,
-            )
-
-        key = parts[1]
-        if key not in self.valid_keys:
-            logger.warning("Auth failed: invalid API key (client=%s)", client_ip)
-            return JSONResponse(
-                {"error": "Invalid API key"},
-                status_code=401,
-            )
-
-        return await call_next(request)
+            reason, body = "missing Authorization header", _MISSING_HEADER_BODY
+        else:
+            # Expect "Bearer <key>"
+            parts = auth_header.decode("latin-1").split(" ", maxsplit=1)
+            if len(parts) != 2 or parts[0] != "Bearer":
+                reason, body = "malformed Authorization header", _MALFORMED_HEADER_BODY
+            else:
+                reason, body = "invalid API key", _INVALID_KEY_BODY
+
+        # Only resolve the client address when the warning will be emitted.
+        if logger.isEnabledFor(logging.WARNING):
+            client = scope.get("client")
+            client_ip = client[0] if client else "unknown"
+            logger.warning("Auth failed: %s (client=%s)", reason, client_ip)
+
+        await _send_unauthorized(send, body)
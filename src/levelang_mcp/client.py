@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+
+from dataclasses import dataclass
 from typing import Any, Self
 
 import httpx
+import orjson
 
 from .config import get_settings
 
 
+@dataclass(frozen=True)
+class _CachedResponse:
+    """A parsed GET response kept for TTL / ETag revalidation."""
+
+    fetched_at: float
+    etag: str | None
+    body: dict[str, Any]
+
+
 class LevelangClient:
     """Async HTTP client wrapping the Levelang backend API.
 
@@ -19,11 +33,47 @@ class LevelangClient:
             result = await client.translate(...)
     """
 
-    def __init__(self) -> None:
+    def __init__(self, transport: httpx.AsyncBaseTransport | None = None) -> None:
+        """Create the client from the current settings.
+
+        Args:
+            transport: Optional httpx transport to send requests through
+                instead of the pooled network transport (e.g. an
+                ``httpx.MockTransport`` in tests).
+        """
         settings = get_settings()
         self.base_url = settings.api_base_url
         self._api_key = settings.api_key
-        self._client = httpx.AsyncClient(timeout=30.0)
+        # Language configs change rarely: serve them from memory for this
+        # long before revalidating with the backend (seconds).
+        self._cache_ttl = settings.languages_cache_ttl_s
+        # HTTP/2 lets concurrent translations (e.g. translate_compare)
+        # multiplex over one connection.  ``retries`` only covers failures to
+        # connect, so a dropped pooled socket is replaced transparently while
+        # POSTs that reached the backend are never replayed.
+        if transport is None:
+            transport = httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.http_max_connections,
+                    max_keepalive_connections=settings.http_max_keepalive,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            )
+        # base_url and default headers are baked into the client so request
+        # methods only pass relative paths.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self._static_headers(),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=transport,
+        )
+        # Keyed by request path (e.g. "/languages/details").
+        self._cache: dict[str, _CachedResponse] = {}
+        # Fetches currently on the wire, so concurrent misses for the same
+        # path share one backend request.
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
 
     async def __aenter__(self) -> Self:
         return self
@@ -31,8 +81,8 @@ class LevelangClient:
     async def __aexit__(self, *args: object) -> None:
         await self.close()
 
-    def _headers(self) -> dict[str, str]:
-        """Build request headers, conditionally including auth."""
+    def _static_headers(self) -> dict[str, str]:
+        """Build default request headers, conditionally including auth."""
         headers: dict[str, str] = {
             "Content-Type": "application/json",
         }
@@ -63,35 +113,63 @@ class LevelangClient:
         if model is not None:
             body["model"] = model
         response = await self._client.post(
-            f"{self.base_url}/translate",
-            headers=self._headers(),
-            json=body,
+            "/translate",
+            content=orjson.dumps(body),
         )
         response.raise_for_status()
-        result: dict[str, Any] = response.json()
+        result: dict[str, Any] = orjson.loads(response.content)
+        return result
+
+    async def _get_cached(self, path: str) -> dict[str, Any]:
+        """GET *path* through an in-process TTL cache.
+
+        Fresh entries are returned without touching the network.  Expired
+        entries are revalidated with ``If-None-Match`` so an unchanged
+        resource costs a 304 round-trip instead of a full download and parse.
+        Concurrent misses for the same path wait on a single request.
+        """
+        cached = self._cache.get(path)
+        if (
+            cached is not None
+            and time.monotonic() - cached.fetched_at < self._cache_ttl
+        ):
+            return cached.body
+
+        task = self._inflight.get(path)
+        if task is None:
+            task = asyncio.create_task(self._fetch(path, cached))
+            self._inflight[path] = task
+            task.add_done_callback(lambda _: self._inflight.pop(path, None))
+        # Shield the shared fetch: one caller being cancelled must not
+        # cancel it for everyone else waiting on the same path.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, path: str, cached: _CachedResponse | None) -> dict[str, Any]:
+        """GET *path* (revalidating *cached* if given) and store the result."""
+        now = time.monotonic()
+        headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+        response = await self._client.get(path, headers=headers, timeout=10.0)
+        if cached is not None and response.status_code == 304:
+            result = cached.body
+            etag = response.headers.get("ETag", cached.etag)
+        else:
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+            etag = response.headers.get("ETag")
+        self._cache[path] = _CachedResponse(fetched_at=now, etag=etag, body=result)
         return result
 
     async def get_languages(self) -> dict[str, Any]:
         """Call GET /languages/details and return full language configs."""
-        response = await self._client.get(
-            f"{self.base_url}/languages/details",
-            headers=self._headers(),
-            timeout=10.0,
-        )
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+        return await self._get_cached("/languages/details")
 
     async def get_language(self, code: str) -> dict[str, Any]:
         """Call GET /languages/{code} and return single language config."""
-        response = await self._client.get(
-            f"{self.base_url}/languages/{code}",
-            headers=self._headers(),
-            timeout=10.0,
-        )
-        response.raise_for_status()
-        result: dict[str, Any] = response.json()
-        return result
+        return await self._get_cached(f"/languages/{code}")
+
+    def clear_cache(self) -> None:
+        """Drop all cached language responses."""
+        self._cache.clear()
 
     async def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 
 from dataclasses import dataclass
@@ -11,7 +12,10 @@ from dotenv import load_dotenv
 
 # Load .env once at import time.  Existing environment variables take
 # precedence over values defined in .env (the python-dotenv default).
-load_dotenv()
+# Containerized deploys set the environment directly and can skip the
+# .env file search with LEVELANG_LOAD_DOTENV=0.
+if os.environ.get("LEVELANG_LOAD_DOTENV", "1") == "1":
+    load_dotenv()
 
 
 def _parse_api_keys(raw: str | None) -> frozenset[str]:
@@ -38,18 +42,16 @@ class Settings:
     mcp_api_keys: frozenset[str]
     log_level: str
     log_format: str
+    languages_cache_ttl_s: float
+    translate_compare_concurrency: int
+    http_max_connections: int
+    http_max_keepalive: int
 
 
-_settings: Settings | None = None
-
-
+@functools.cache
 def get_settings() -> Settings:
     """Load settings from environment variables (cached after first call)."""
-    global _settings
-    if _settings is not None:
-        return _settings
-
-    _settings = Settings(
+    return Settings(
         api_base_url=os.environ.get(
             "LEVELANG_API_BASE_URL",
             "http://localhost:8000/api/v1",
@@ -61,11 +63,19 @@ def get_settings() -> Settings:
         mcp_api_keys=_parse_api_keys(os.environ.get("MCP_API_KEYS")),
         log_level=os.environ.get("LOG_LEVEL", "INFO"),
         log_format=os.environ.get("LOG_FORMAT", "auto"),
+        languages_cache_ttl_s=float(
+            os.environ.get("LEVELANG_LANGUAGES_CACHE_TTL", "300")
+        ),
+        translate_compare_concurrency=int(
+            os.environ.get("LEVELANG_COMPARE_CONCURRENCY", "4")
+        ),
+        http_max_connections=int(
+            os.environ.get("LEVELANG_HTTP_MAX_CONNECTIONS", "100")
+        ),
+        http_max_keepalive=int(os.environ.get("LEVELANG_HTTP_MAX_KEEPALIVE", "20")),
     )
-    return _settings
 
 
 def reset_settings() -> None:
     """Reset cached settings (useful for testing)."""
-    global _settings
-    _settings = None
+    get_settings.cache_clear()
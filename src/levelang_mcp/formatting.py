@@ -5,6 +5,32 @@ from __future__ import annotations
 from typing import Any
 
 
+# Metadata fields read by format_translation, fetched in one pass.
+_METADATA_KEYS = (
+    "level",
+    "level_description",
+    "mood",
+    "mode",
+    "provider",
+    "model",
+    "processing_time_ms",
+)
+
+# (label, response key) of the per-language option lists.
+_SECTIONS = (
+    ("Levels", "levels"),
+    ("Moods", "moods"),
+    ("Modes", "modes"),
+)
+
+# (heading, response key, show "(default)" marker) for format_language_detail.
+_DETAIL_SECTIONS = (
+    ("Proficiency Levels", "levels", False),
+    ("Moods", "moods", True),
+    ("Modes", "modes", True),
+)
+
+
 def format_translation(response: dict[str, Any]) -> str:
     """Format a translation API response into a readable string.
 
@@ -26,42 +52,63 @@ def format_translation(response: dict[str, Any]) -> str:
             "session_id": "..." | null,
         }
     """
-    lines: list[str] = []
-
-    lines.append(f"Translation: {response['translation']}")
-
-    if response.get("transliteration"):
-        lines.append(f"Transliteration: {response['transliteration']}")
-
-    if response.get("transcription"):
-        lines.append(f"Transcription: {response['transcription']}")
+    transliteration = response.get("transliteration")
+    transcription = response.get("transcription")
+    metadata = response.get("metadata") or {}
+    level, level_desc, mood, mode, provider, model, processing_time = map(
+        metadata.get, _METADATA_KEYS
+    )
+
+    # Optional lines are None when absent and filtered out below.
+    lines = (
+        f"Translation: {response['translation']}",
+        f"Transliteration: {transliteration}" if transliteration else None,
+        f"Transcription: {transcription}" if transcription else None,
+        (f"Level: {level} ({level_desc})" if level_desc else f"Level: {level}")
+        if level
+        else None,
+        f"Mood: {mood}" if mood else None,
+        f"Mode: {mode}" if mode else None,
+        (f"Provider: {provider} / {model}" if model else f"Provider: {provider}")
+        if provider
+        else None,
+        f"Processing time: {processing_time}ms"
+        if processing_time is not None
+        else None,
+    )
+    return "\n".join(filter(None, lines))
+
+
+def _roles(language: dict[str, Any]) -> str:
+    """Return the comma-separated source/target roles of a language."""
+    roles: list[str] = []
+    if language.get("can_be_source"):
+        roles.append("source")
+    if language.get("can_be_target"):
+        roles.append("target")
+    return ", ".join(roles)
 
-    metadata = response.get("metadata", {})
-    if metadata:
-        level = metadata.get("level", "")
-        level_desc = metadata.get("level_description", "")
-        if level and level_desc:
-            lines.append(f"Level: {level} ({level_desc})")
-        elif level:
-            lines.append(f"Level: {level}")
 
-        if metadata.get("mood"):
-            lines.append(f"Mood: {metadata['mood']}")
+def _display_name(item: dict[str, Any]) -> str:
+    """Return a level/mood/mode entry's display name, falling back to its code."""
+    name: str = item.get("display_name", item.get("code", ""))
+    return name
 
-        if metadata.get("mode"):
-            lines.append(f"Mode: {metadata['mode']}")
 
-        provider = metadata.get("provider", "")
-        model = metadata.get("model", "")
-        if provider and model:
-            lines.append(f"Provider: {provider} / {model}")
-        elif provider:
-            lines.append(f"Provider: {provider}")
+def _language_summary(lang: dict[str, Any]) -> str:
+    """Format one entry of the /languages/details response as a short block."""
+    parts: list[str] = [f"{lang['name']} ({lang['code']})"]
+    parts.extend(
+        f"  {label}: {', '.join(map(_display_name, items))}"
+        for label, key in _SECTIONS
+        if (items := lang.get(key))
+    )
 
-        if metadata.get("processing_time_ms") is not None:
-            lines.append(f"Processing time: {metadata['processing_time_ms']}ms")
+    roles = _roles(lang)
+    if roles:
+        parts.append(f"  Can be: {roles}")
 
-    return "\n".join(lines)
+    return "\n".join(parts)
 
 
 def format_language_list(response: dict[str, Any]) -> str:
@@ -83,45 +130,23 @@ def format_language_list(response: dict[str, Any]) -> str:
             "total_count": 5,
         }
     """
-    languages = response.get("languages", [])
+    languages = response.get("languages")
     if not languages:
         return "No languages available."
 
-    lines: list[str] = ["Supported Languages:", ""]
-
-    for lang in languages:
-        lines.append(f"{lang['name']} ({lang['code']})")
-
-        # Levels
-        levels = lang.get("levels", [])
-        if levels:
-            level_names = [lv.get("display_name", lv.get("code", "")) for lv in levels]
-            lines.append(f"  Levels: {', '.join(level_names)}")
-
-        # Moods
-        moods = lang.get("moods", [])
-        if moods:
-            mood_names = [m.get("display_name", m.get("code", "")) for m in moods]
-            lines.append(f"  Moods: {', '.join(mood_names)}")
+    # Blank line between languages.
+    return "Supported Languages:\n\n" + "\n\n".join(
+        _language_summary(lang) for lang in languages
+    )
 
-        # Modes
-        modes = lang.get("modes", [])
-        if modes:
-            mode_names = [m.get("display_name", m.get("code", "")) for m in modes]
-            lines.append(f"  Modes: {', '.join(mode_names)}")
 
-        # Source/target
-        roles: list[str] = []
-        if lang.get("can_be_source"):
-            roles.append("source")
-        if lang.get("can_be_target"):
-            roles.append("target")
-        if roles:
-            lines.append(f"  Can be: {', '.join(roles)}")
-
-        lines.append("")  # blank line between languages
-
-    return "\n".join(lines).rstrip()
+def _detail_line(item: dict[str, Any], *, mark_default: bool) -> str:
+    """Format one level/mood/mode entry with its optional description."""
+    name = _display_name(item)
+    if mark_default and item.get("is_default"):
+        name += " (default)"
+    desc = item.get("description", "")
+    return f"  {name}: {desc}" if desc else f"  {name}"
 
 
 def format_language_detail(language: dict[str, Any]) -> str:
@@ -129,57 +154,43 @@ def format_language_detail(language: dict[str, Any]) -> str:
 
     Same shape as one entry in the /languages/details response.
     """
-    lines: list[str] = [f"{language['name']} ({language['code']})", ""]
-
-    # Levels with descriptions
-    levels = language.get("levels", [])
-    if levels:
-        lines.append("Proficiency Levels:")
-        for lv in levels:
-            name = lv.get("display_name", lv.get("code", ""))
-            desc = lv.get("description", "")
-            if desc:
-                lines.append(f"  {name}: {desc}")
-            else:
-                lines.append(f"  {name}")
-        lines.append("")
-
-    # Moods with descriptions
-    moods = language.get("moods", [])
-    if moods:
-        lines.append("Moods:")
-        for m in moods:
-            name = m.get("display_name", m.get("code", ""))
-            desc = m.get("description", "")
-            default_marker = " (default)" if m.get("is_default") else ""
-            if desc:
-                lines.append(f"  {name}{default_marker}: {desc}")
-            else:
-                lines.append(f"  {name}{default_marker}")
-        lines.append("")
-
-    # Modes with descriptions
-    modes = language.get("modes", [])
-    if modes:
-        lines.append("Modes:")
-        for m in modes:
-            name = m.get("display_name", m.get("code", ""))
-            desc = m.get("description", "")
-            default_marker = " (default)" if m.get("is_default") else ""
-            if desc:
-                lines.append(f"  {name}{default_marker}: {desc}")
-            else:
-                lines.append(f"  {name}{default_marker}")
-        lines.append("")
+    blocks: list[str] = [f"{language['name']} ({language['code']})"]
+
+    # Levels, moods and modes with descriptions
+    blocks.extend(
+        f"{title}:\n"
+        + "\n".join(_detail_line(item, mark_default=mark_default) for item in items)
+        for title, key, mark_default in _DETAIL_SECTIONS
+        if (items := language.get(key))
+    )
 
     # Source/target
-    roles: list[str] = []
-    if language.get("can_be_source"):
-        roles.append("source")
-    if language.get("can_be_target"):
-        roles.append("target")
+    roles = _roles(language)
     if roles:
-        lines.append(f"Can be used as: {', '.join(roles)}")
+        blocks.append(f"Can be used as: {roles}")
+
+    # Blank line between sections.
+    return "\n\n".join(blocks)
+
+
+def _comparison_block(entry: dict[str, Any]) -> str:
+    """Format one level's entry of a comparison (translation or error)."""
+    lines: list[str] = [f"── {entry['level'].capitalize()} ──"]
+
+    if not entry["ok"]:
+        lines.append(f"  Error: {entry['error']}")
+        return "\n".join(lines)
+
+    result = entry["result"]
+    lines.append(result.get("translation", "(no translation)"))
+
+    transliteration = result.get("transliteration")
+    if transliteration:
+        lines.append(f"  Transliteration: {transliteration}")
+
+    processing_time = (result.get("metadata") or {}).get("processing_time_ms")
+    if processing_time is not None:
+        lines.append(f"  ({processing_time:.0f}ms)")
 
     return "\n".join(lines)
 
@@ -205,34 +216,14 @@ def format_comparison(
         mode: The mode used for all translations (e.g. "spoken", "written").
             Omitted from the header when None or "written".
     """
-    header = f"Language: {language_name} | Mood: {mood.capitalize()}"
-    if mode and mode != "written":
-        header += f" | Mode: {mode.capitalize()}"
-
-    lines: list[str] = [
-        f'Comparing translations of: "{text}"',
-        header,
-        "",
-    ]
-
-    for entry in results:
-        level = entry["level"].capitalize()
-        lines.append(f"── {level} ──")
-
-        if not entry["ok"]:
-            lines.append(f"  Error: {entry['error']}")
-        else:
-            result = entry["result"]
-            lines.append(result.get("translation", "(no translation)"))
-
-            if result.get("transliteration"):
-                lines.append(f"  Transliteration: {result['transliteration']}")
-
-            metadata = result.get("metadata", {})
-            processing_time = metadata.get("processing_time_ms")
-            if processing_time is not None:
-                lines.append(f"  ({processing_time:.0f}ms)")
-
-        lines.append("")
-
-    return "\n".join(lines).rstrip()
+    header = f"Language: {language_name} | Mood: {mood.capitalize()}" + (
+        f" | Mode: {mode.capitalize()}" if mode and mode != "written" else ""
+    )
+
+    # Blank line between the header and each level's block.
+    return "\n\n".join(
+        (
+            f'Comparing translations of: "{text}"\n{header}',
+            *map(_comparison_block, results),
+        )
+    )
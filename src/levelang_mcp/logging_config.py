@@ -11,10 +11,33 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
+import time
 
-from datetime import UTC, datetime
+import orjson
+
+
+def _iso_utc(created: float) -> str:
+    """Format a ``LogRecord.created`` epoch timestamp as ISO-8601 UTC.
+
+    Equivalent to ``datetime.fromtimestamp(created, tz=UTC).isoformat()``
+    (microseconds omitted when zero) without allocating a ``datetime`` per
+    record.
+    """
+    seconds = int(created)
+    # Round like datetime does, carrying into the next second if needed.
+    micros = round((created - seconds) * 1_000_000)
+    if micros == 1_000_000:
+        seconds += 1
+        micros = 0
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    if micros == 0:
+        return f"{stamp}+00:00"
+    return f"{stamp}.{micros:06d}+00:00"
 
 
 class JSONFormatter(logging.Formatter):
@@ -22,18 +45,53 @@ class JSONFormatter(logging.Formatter):
 
     Fields: ``timestamp`` (ISO-8601 UTC), ``level``, ``logger``, ``message``.
     If the record carries exception info it is included under ``exception``.
+
+    Output is compact and non-ASCII text is written as raw UTF-8 rather than
+    ASCII escapes.  Strings orjson refuses to encode (lone surrogates)
+    fall back to :func:`json.dumps`, which escapes them.
     """
 
     def format(self, record: logging.LogRecord) -> str:
         log_data: dict[str, str] = {
-            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "timestamp": _iso_utc(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info and record.exc_info[0] is not None:
             log_data["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_data, default=str)
+        try:
+            return orjson.dumps(log_data).decode()
+        except orjson.JSONEncodeError:
+            return json.dumps(log_data, separators=(",", ":"))
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueue records untouched so all formatting happens on the listener.
+
+    The stock ``prepare()`` formats the message on the calling thread and
+    drops ``exc_info``, which would keep serialization on the hot path and
+    hide tracebacks from :class:`JSONFormatter`.  Records never leave the
+    process, so they don't need to be made picklable.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Deliberately deferred: callers must pass immutable log args.
+        return record
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush pending records and stop the background logging thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 _TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
@@ -49,6 +107,10 @@ def setup_logging(
 
     Call once at startup (from ``__main__``) before any other work.
 
+    Log calls only enqueue the record; a background
+    :class:`~logging.handlers.QueueListener` thread formats it and writes
+    it to stderr, so request-handling code never blocks on the stream lock.
+
     Parameters
     ----------
     log_level:
@@ -67,9 +129,24 @@ def setup_logging(
     handler = logging.StreamHandler()
     handler.setFormatter(formatter)
 
+    global _listener
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    listener = logging.handlers.QueueListener(
+        log_queue, handler, respect_handler_level=True
+    )
+    queue_handler.listener = listener
+    listener.start()
+
     # Configure the package-level logger — all levelang_mcp.* loggers
     # inherit this handler.
     pkg_logger = logging.getLogger("levelang_mcp")
     pkg_logger.setLevel(level)
-    pkg_logger.handlers = [handler]
+    pkg_logger.handlers = [queue_handler]
     pkg_logger.propagate = False
+
+    # Stop any previous listener only once nothing can enqueue to it any
+    # more, so records logged during reconfiguration are still written.
+    old_listener, _listener = _listener, listener
+    if old_listener is not None:
+        old_listener.stop()
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+
+from collections.abc import Awaitable, Callable
+from typing import Any, ParamSpec
 
 import httpx
 
@@ -25,12 +29,119 @@ def _sanitize_text(text: str) -> str:
     newlines -- multi-line input (poems, paragraphs) is legitimate and
     should be preserved. The backend is responsible for handling newlines
     safely when constructing LLM prompts and parsing responses.
+
+    Already-clean input (the common case) is returned as-is rather than
+    copied by ``str.strip()``.
     """
+    if text and not text[0].isspace() and not text[-1].isspace():
+        return text
     return text.strip()
 
 
+_P = ParamSpec("_P")
+
+_CONNECT_ERROR_MESSAGE = (
+    "Cannot reach the Levelang backend. Check that the service is running."
+)
+
+
+# Fixed messages for backend statuses that mean the same thing for every tool.
+_STATUS_MESSAGES: dict[int, str] = {
+    429: "Rate limit reached. Please wait a moment and try again.",
+}
+
+
+def _status_error_message(response: httpx.Response, unavailable: str | None) -> str:
+    """Turn a backend error response into a message for the LLM."""
+    status = response.status_code
+    if status == 422:
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if isinstance(body, dict):
+            detail = body.get("detail", "Validation error")
+        else:
+            detail = response.text or "Validation error"
+        return f"Invalid request: {detail}"
+    message = _STATUS_MESSAGES.get(status)
+    if message is not None:
+        return message
+    if status >= 500 and unavailable is not None:
+        return unavailable
+    return f"Backend error (HTTP {status}): {response.text}"
+
+
+def _exception_message(exc: Exception, messages: dict[type[Exception], str]) -> str:
+    """Look up the message for *exc* by walking its class hierarchy.
+
+    httpx raises concrete subclasses (e.g. ``ReadTimeout``), so *messages*
+    only needs entries for the base classes.
+    """
+    for cls in type(exc).__mro__:
+        message = messages.get(cls)
+        if message is not None:
+            return message
+    return f"Unexpected error: {exc}"
+
+
+def _level_error_message(exc: Exception) -> str:
+    """Message for one failed level of a comparison, reported inline."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return _status_error_message(exc.response, None)
+    if isinstance(exc, httpx.TimeoutException):
+        return "Request timed out."
+    return str(exc)
+
+
+def _handle_backend_errors(
+    *, unavailable: str | None, timeout: str
+) -> Callable[[Callable[_P, Awaitable[str]]], Callable[_P, Awaitable[str]]]:
+    """Wrap a tool so backend failures come back as readable messages.
+
+    Args:
+        unavailable: Message for HTTP 5xx responses, or ``None`` to report
+            them as a generic backend error.
+        timeout: Message for request timeouts.
+    """
+    messages: dict[type[Exception], str] = {
+        httpx.TimeoutException: timeout,
+        httpx.ConnectError: _CONNECT_ERROR_MESSAGE,
+    }
+
+    def decorator(
+        fn: Callable[_P, Awaitable[str]],
+    ) -> Callable[_P, Awaitable[str]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> str:
+            try:
+                return await fn(*args, **kwargs)
+            except httpx.HTTPStatusError as e:
+                return _status_error_message(e.response, unavailable)
+            except Exception as e:
+                return _exception_message(e, messages)
+
+        return wrapper
+
+    return decorator
+
+
 settings = get_settings()
 
+# Shared across all translate_compare calls so that concurrent comparisons
+# together can't flood the backend (and trip its rate limit).  Created on
+# first use: the semaphore belongs to the event loop the server runs on.
+_compare_semaphore: asyncio.Semaphore | None = None
+
+
+def _get_compare_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide translate_compare semaphore."""
+    global _compare_semaphore
+    if _compare_semaphore is None:
+        _compare_semaphore = asyncio.Semaphore(settings.translate_compare_concurrency)
+    return _compare_semaphore
+
+
 mcp = FastMCP(
     "Levelang",
     instructions="Proficiency-calibrated translation service. Translates text at a "
@@ -51,6 +162,10 @@ levelang = LevelangClient()
 
 
 @mcp.tool()
+@_handle_backend_errors(
+    unavailable="Translation service is temporarily unavailable. Please try again.",
+    timeout="Translation request timed out. The backend may be under heavy load.",
+)
 async def translate(
     text: str,
     target_language: str,
@@ -84,36 +199,23 @@ async def translate(
     Returns:
         The translated text with metadata about the translation.
     """
-    try:
-        result = await levelang.translate(
-            text=_sanitize_text(text),
-            source_language_code=source_language,
-            target_language_code=target_language,
-            level=level,
-            mood=mood,
-            mode=mode,
-            model=model,
-        )
-        return format_translation(result)
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 422:
-            detail = e.response.json().get("detail", "Validation error")
-            return f"Invalid request: {detail}"
-        elif e.response.status_code == 429:
-            return "Rate limit reached. Please wait a moment and try again."
-        elif e.response.status_code >= 500:
-            return "Translation service is temporarily unavailable. Please try again."
-        else:
-            return f"Backend error (HTTP {e.response.status_code}): {e.response.text}"
-    except httpx.TimeoutException:
-        return "Translation request timed out. The backend may be under heavy load."
-    except httpx.ConnectError:
-        return "Cannot reach the Levelang backend. Check that the service is running."
-    except Exception as e:
-        return f"Unexpected error: {e}"
+    result = await levelang.translate(
+        text=_sanitize_text(text),
+        source_language_code=source_language,
+        target_language_code=target_language,
+        level=level,
+        mood=mood,
+        mode=mode,
+        model=model,
+    )
+    return format_translation(result)
 
 
 @mcp.tool()
+@_handle_backend_errors(
+    unavailable="Language service is temporarily unavailable. Please try again.",
+    timeout="Request timed out while fetching languages.",
+)
 async def list_languages() -> str:
     """List all languages supported by Levelang with their available levels and moods.
 
@@ -123,22 +225,15 @@ async def list_languages() -> str:
     Returns:
         Formatted list of supported languages and their configurations.
     """
-    try:
-        result = await levelang.get_languages()
-        return format_language_list(result)
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code >= 500:
-            return "Language service is temporarily unavailable. Please try again."
-        return f"Backend error (HTTP {e.response.status_code}): {e.response.text}"
-    except httpx.TimeoutException:
-        return "Request timed out while fetching languages."
-    except httpx.ConnectError:
-        return "Cannot reach the Levelang backend. Check that the service is running."
-    except Exception as e:
-        return f"Unexpected error: {e}"
+    result = await levelang.get_languages()
+    return await asyncio.to_thread(format_language_list, result)
 
 
 @mcp.tool()
+@_handle_backend_errors(
+    unavailable=None,
+    timeout="Request timed out while fetching language details.",
+)
 async def translate_compare(
     text: str,
     target_language: str,
@@ -175,19 +270,72 @@ async def translate_compare(
     """
     sanitized = _sanitize_text(text)
 
-    # Fetch available levels for this language
+    # Translate at the given levels concurrently (bounded).  The backend has
+    # no multi-level endpoint, so this is one POST /translate per level; the
+    # requests multiplex over the client's pooled HTTP/2 connection.
+    semaphore = _get_compare_semaphore()
+
+    async def _translate_at_level(level: str) -> dict[str, Any]:
+        async with semaphore:
+            return await levelang.translate(
+                text=sanitized,
+                source_language_code=source_language,
+                target_language_code=target_language,
+                level=level,
+                mood=mood,
+                mode=mode,
+                model=model,
+            )
+
+    async def _translate_levels(level_codes: list[str]) -> list[dict[str, Any]]:
+        # One failed level shouldn't sink the whole comparison: collect
+        # exceptions alongside results and report them per level.
+        outcomes = await asyncio.gather(
+            *[_translate_at_level(lv) for lv in level_codes], return_exceptions=True
+        )
+        results: list[dict[str, Any]] = []
+        for level, outcome in zip(level_codes, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                results.append(
+                    {
+                        "level": level,
+                        "ok": False,
+                        "error": _level_error_message(outcome),
+                    }
+                )
+            elif isinstance(outcome, BaseException):
+                raise outcome  # cancellation, KeyboardInterrupt, ...
+            else:
+                results.append({"level": level, "ok": True, "result": outcome})
+        return results
+
+    # A single requested level needs no level discovery: skip the language
+    # lookup and let the backend validate the level (failures, e.g. an
+    # unknown level, are reported inline like any other level's).
+    if levels is not None and len(levels) == 1:
+        (single,) = await _translate_levels(levels)
+        language_name = target_language
+        if single["ok"]:
+            language_name = (single["result"].get("metadata") or {}).get(
+                "target_language", target_language
+            )
+        return format_comparison(
+            text=sanitized,
+            language_name=language_name,
+            mood=mood,
+            results=[single],
+            mode=mode,
+        )
+
+    # Fetch available levels for this language.  Per-level translation
+    # failures are reported inline below, so other errors can only come from
+    # this lookup and are handled by the decorator.
     try:
         lang_config = await levelang.get_language(target_language)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return f"Language '{target_language}' not found. Use list_languages to see available codes."
-        return f"Backend error (HTTP {e.response.status_code}): {e.response.text}"
-    except httpx.ConnectError:
-        return "Cannot reach the Levelang backend. Check that the service is running."
-    except httpx.TimeoutException:
-        return "Request timed out while fetching language details."
-    except Exception as e:
-        return f"Unexpected error: {e}"
+        raise
 
     available_levels = lang_config.get("levels", [])
     if not available_levels:
@@ -196,7 +344,9 @@ async def translate_compare(
     available_codes = [lv.get("code", "") for lv in available_levels if lv.get("code")]
 
     if levels is not None:
-        invalid = [lv for lv in levels if lv not in available_codes]
+        # Keep the list for message ordering; test membership against a set.
+        known_codes = frozenset(available_codes)
+        invalid = [lv for lv in levels if lv not in known_codes]
         if invalid:
             return (
                 f"Invalid level(s): {', '.join(invalid)}. "
@@ -206,29 +356,16 @@ async def translate_compare(
     else:
         level_codes = available_codes
 
-    # Translate at requested levels concurrently
-    async def _translate_at_level(level: str) -> dict:
-        try:
-            result = await levelang.translate(
-                text=sanitized,
-                source_language_code=source_language,
-                target_language_code=target_language,
-                level=level,
-                mood=mood,
-                mode=mode,
-                model=model,
-            )
-            return {"level": level, "ok": True, "result": result}
-        except Exception as e:
-            return {"level": level, "ok": False, "error": str(e)}
-
-    results = await asyncio.gather(*[_translate_at_level(lv) for lv in level_codes])
+    results = await _translate_levels(level_codes)
 
-    return format_comparison(
+    # Formatting every level's output can take a while for long texts; do it
+    # off the event loop so other sessions' requests keep being served.
+    return await asyncio.to_thread(
+        format_comparison,
         text=sanitized,
         language_name=lang_config.get("name", target_language),
         mood=mood,
-        results=list(results),
+        results=results,
         mode=mode,
     )
 
@@ -243,7 +380,7 @@ async def languages_resource() -> str:
     """List of all supported languages with their levels and moods."""
     try:
         result = await levelang.get_languages()
-        return format_language_list(result)
+        return await asyncio.to_thread(format_language_list, result)
     except Exception:
         return "Unable to fetch language list from the backend."
 
@@ -253,7 +390,7 @@ async def language_detail_resource(language_code: str) -> str:
     """Detailed configuration for a specific language including level descriptions."""
     try:
         result = await levelang.get_language(language_code)
-        return format_language_detail(result)
+        return await asyncio.to_thread(format_language_detail, result)
     except httpx.HTTPStatusError as e:
         if e.response.status_code == 404:
             return f"Language '{language_code}' not found."
@@ -274,6 +411,12 @@ def compare_levels(language: str = "French") -> str:
     Args:
         language: Target language name
     """
+    return _compare_levels_prompt(language)
+
+
+@functools.lru_cache(maxsize=64)
+def _compare_levels_prompt(language: str) -> str:
+    """Build the compare_levels prompt text (memoized per language)."""
     return f"""The user will provide a sentence or short text.
 Please translate it into {language} at all available levels using the
 translate_compare tool. If the user specifies particular levels to compare,
@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
+
 import pytest
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop, like the server; it is POSIX-only."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+
+    import uvloop
+
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture(autouse=True)
 def _clean_settings():
-    """Reset cached settings before each test so env var changes take effect."""
+    """Reset cached settings around each test so env var changes take effect.
+
+    The reset beforehand also drops anything cached by wider-scoped
+    fixtures, which are set up before the per-test env baseline.
+    """
     from levelang_mcp.config import reset_settings
 
     reset_settings()
@@ -1,158 +1,245 @@
-"""Sample API response data for tests."""
-
-SAMPLE_TRANSLATION_RESPONSE = {
-    "translation": "Bonjour le monde",
-    "transliteration": None,
-    "transcription": None,
-    "metadata": {
-        "source_language": "English",
-        "target_language": "French",
-        "source_code": "eng",
-        "target_code": "fra",
-        "level": "A2",
-        "level_description": "elementary proficiency",
-        "mood": "Casual",
-        "mode": "Written",
-        "provider": "gemini",
-        "model": "gemini-2.5-flash-lite",
-        "temperature": 0.1,
-        "processing_time_ms": 800,
-    },
-    "session_id": "abc-123",
-}
-
-SAMPLE_TRANSLATION_WITH_TRANSLIT = {
-    "translation": "\u4f60\u597d\u4e16\u754c",
-    "transliteration": "n\u01d0 h\u01ceo sh\u00ec ji\u00e8",
-    "transcription": None,
-    "metadata": {
-        "source_language": "English",
-        "target_language": "Mandarin Chinese",
-        "source_code": "eng",
-        "target_code": "cmn",
-        "level": "HSK1",
-        "level_description": "basic vocabulary",
-        "mood": "Casual",
-        "mode": "Written",
-        "provider": "gemini",
-        "model": "gemini-2.5-flash-lite",
-        "temperature": 0.1,
-        "processing_time_ms": 950,
-    },
-    "session_id": None,
-}
-
-SAMPLE_LANGUAGES_RESPONSE = {
-    "languages": [
-        {
-            "code": "fra",
-            "name": "French",
-            "can_be_source": False,
-            "can_be_target": True,
-            "supports_transliteration": False,
-            "levels": [
-                {
-                    "code": "beginner",
-                    "display_name": "Beginner",
-                    "description": "Basic vocabulary",
-                },
-                {
-                    "code": "intermediate",
-                    "display_name": "Intermediate",
-                    "description": "Complex structures",
-                },
-                {
-                    "code": "advanced",
-                    "display_name": "Advanced",
-                    "description": "Full grammar",
-                },
-                {
-                    "code": "fluent",
-                    "display_name": "Fluent",
-                    "description": "Native equivalent",
-                },
-            ],
-            "moods": [
-                {"code": "casual", "display_name": "Casual", "is_default": True},
-                {"code": "polite", "display_name": "Polite", "is_default": False},
-                {"code": "formal", "display_name": "Formal", "is_default": False},
-            ],
-            "modes": [
-                {"code": "written", "display_name": "Written", "is_default": True},
-                {"code": "spoken", "display_name": "Spoken", "is_default": False},
-            ],
-        },
-        {
-            "code": "cmn",
-            "name": "Mandarin Chinese",
-            "can_be_source": False,
-            "can_be_target": True,
-            "supports_transliteration": True,
-            "levels": [
-                {
-                    "code": "beginner",
-                    "display_name": "Beginner",
-                    "description": "Basic vocabulary",
-                },
-                {
-                    "code": "intermediate",
-                    "display_name": "Intermediate",
-                    "description": "Complex structures",
-                },
-            ],
-            "moods": [
-                {"code": "casual", "display_name": "Casual", "is_default": True},
-            ],
-            "modes": [],
-        },
-    ],
-    "total_count": 2,
-}
-
-SAMPLE_SINGLE_LANGUAGE = {
-    "code": "fra",
-    "name": "French",
-    "can_be_source": False,
-    "can_be_target": True,
-    "supports_transliteration": False,
-    "levels": [
-        {
-            "code": "beginner",
-            "display_name": "Beginner",
-            "description": "Basic vocabulary",
-        },
-        {
-            "code": "intermediate",
-            "display_name": "Intermediate",
-            "description": "Complex structures",
+"""Sample API response data for tests.
+
+The payloads are shared by every test, so they are frozen (read-only
+mappings, tuples instead of lists) rather than copied per test.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any
+
+import httpx
+import orjson
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+SAMPLE_TRANSLATION_RESPONSE = _freeze(
+    {
+        "translation": "Bonjour le monde",
+        "transliteration": None,
+        "transcription": None,
+        "metadata": {
+            "source_language": "English",
+            "target_language": "French",
+            "source_code": "eng",
+            "target_code": "fra",
+            "level": "A2",
+            "level_description": "elementary proficiency",
+            "mood": "Casual",
+            "mode": "Written",
+            "provider": "gemini",
+            "model": "gemini-2.5-flash-lite",
+            "temperature": 0.1,
+            "processing_time_ms": 800,
         },
-    ],
-    "moods": [
-        {
-            "code": "casual",
-            "display_name": "Casual",
-            "is_default": True,
-            "description": "Everyday conversation",
+        "session_id": "abc-123",
+    }
+)
+
+SAMPLE_TRANSLATION_RESPONSE_WITH_TRANSCRIPTION = MappingProxyType(
+    {**SAMPLE_TRANSLATION_RESPONSE, "transcription": "Hello world"}
+)
+
+SAMPLE_TRANSLATION_WITH_TRANSLIT = _freeze(
+    {
+        "translation": "\u4f60\u597d\u4e16\u754c",
+        "transliteration": "n\u01d0 h\u01ceo sh\u00ec ji\u00e8",
+        "transcription": None,
+        "metadata": {
+            "source_language": "English",
+            "target_language": "Mandarin Chinese",
+            "source_code": "eng",
+            "target_code": "cmn",
+            "level": "HSK1",
+            "level_description": "basic vocabulary",
+            "mood": "Casual",
+            "mode": "Written",
+            "provider": "gemini",
+            "model": "gemini-2.5-flash-lite",
+            "temperature": 0.1,
+            "processing_time_ms": 950,
         },
+        "session_id": None,
+    }
+)
+
+SAMPLE_LANGUAGES_RESPONSE = _freeze(
+    {
+        "languages": [
+            {
+                "code": "fra",
+                "name": "French",
+                "can_be_source": False,
+                "can_be_target": True,
+                "supports_transliteration": False,
+                "levels": [
+                    {
+                        "code": "beginner",
+                        "display_name": "Beginner",
+                        "description": "Basic vocabulary",
+                    },
+                    {
+                        "code": "intermediate",
+                        "display_name": "Intermediate",
+                        "description": "Complex structures",
+                    },
+                    {
+                        "code": "advanced",
+                        "display_name": "Advanced",
+                        "description": "Full grammar",
+                    },
+                    {
+                        "code": "fluent",
+                        "display_name": "Fluent",
+                        "description": "Native equivalent",
+                    },
+                ],
+                "moods": [
+                    {"code": "casual", "display_name": "Casual", "is_default": True},
+                    {"code": "polite", "display_name": "Polite", "is_default": False},
+                    {"code": "formal", "display_name": "Formal", "is_default": False},
+                ],
+                "modes": [
+                    {"code": "written", "display_name": "Written", "is_default": True},
+                    {"code": "spoken", "display_name": "Spoken", "is_default": False},
+                ],
+            },
+            {
+                "code": "cmn",
+                "name": "Mandarin Chinese",
+                "can_be_source": False,
+                "can_be_target": True,
+                "supports_transliteration": True,
+                "levels": [
+                    {
+                        "code": "beginner",
+                        "display_name": "Beginner",
+                        "description": "Basic vocabulary",
+                    },
+                    {
+                        "code": "intermediate",
+                        "display_name": "Intermediate",
+                        "description": "Complex structures",
+                    },
+                ],
+                "moods": [
+                    {"code": "casual", "display_name": "Casual", "is_default": True},
+                ],
+                "modes": [],
+            },
+        ],
+        "total_count": 2,
+    }
+)
+
+SAMPLE_SINGLE_LANGUAGE = _freeze(
+    {
+        "code": "fra",
+        "name": "French",
+        "can_be_source": False,
+        "can_be_target": True,
+        "supports_transliteration": False,
+        "levels": [
+            {
+                "code": "beginner",
+                "display_name": "Beginner",
+                "description": "Basic vocabulary",
+            },
+            {
+                "code": "intermediate",
+                "display_name": "Intermediate",
+                "description": "Complex structures",
+            },
+        ],
+        "moods": [
+            {
+                "code": "casual",
+                "display_name": "Casual",
+                "is_default": True,
+                "description": "Everyday conversation",
+            },
+            {
+                "code": "formal",
+                "display_name": "Formal",
+                "is_default": False,
+                "description": "Professional contexts",
+            },
+        ],
+        "modes": [
+            {
+                "code": "written",
+                "display_name": "Written",
+                "is_default": True,
+                "description": "Standard written French as taught in textbooks",
+            },
+            {
+                "code": "spoken",
+                "display_name": "Spoken",
+                "is_default": False,
+                "description": "How native French speakers actually talk in everyday conversation",
+            },
+        ],
+    }
+)
+
+# Language config and per-level results for translate_compare tests.
+SAMPLE_FRENCH_LANGUAGE_META = _freeze(
+    {
+        "name": "French",
+        "code": "fra",
+        "levels": [
+            {"code": "beginner", "display_name": "Beginner"},
+            {"code": "intermediate", "display_name": "Intermediate"},
+            {"code": "advanced", "display_name": "Advanced"},
+            {"code": "fluent", "display_name": "Fluent"},
+        ],
+        "moods": [{"code": "casual", "display_name": "Casual"}],
+    }
+)
+
+SAMPLE_COMPARE_RESPONSES = _freeze(
+    [
         {
-            "code": "formal",
-            "display_name": "Formal",
-            "is_default": False,
-            "description": "Professional contexts",
+            "translation": "Bonjour",
+            "transliteration": None,
+            "metadata": {"processing_time_ms": 800},
         },
-    ],
-    "modes": [
         {
-            "code": "written",
-            "display_name": "Written",
-            "is_default": True,
-            "description": "Standard written French as taught in textbooks",
+            "translation": "Bonjour, comment allez-vous",
+            "transliteration": None,
+            "metadata": {"processing_time_ms": 900},
         },
         {
-            "code": "spoken",
-            "display_name": "Spoken",
-            "is_default": False,
-            "description": "How native French speakers actually talk in everyday conversation",
+            "translation": "Bonjour, comment vous portez-vous aujourd'hui",
+            "transliteration": None,
+            "metadata": {"processing_time_ms": 1000},
         },
-    ],
-}
+    ]
+)
+
+# Response bodies for mocked HTTP responses, serialized once per session.
+# orjson hands the read-only mappings to ``default``, which unwraps them.
+SAMPLE_TRANSLATION_RESPONSE_JSON = orjson.dumps(
+    SAMPLE_TRANSLATION_RESPONSE, default=dict
+)
+SAMPLE_LANGUAGES_RESPONSE_JSON = orjson.dumps(SAMPLE_LANGUAGES_RESPONSE, default=dict)
+SAMPLE_SINGLE_LANGUAGE_JSON = orjson.dumps(SAMPLE_SINGLE_LANGUAGE, default=dict)
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> httpx.Response:
+    """A 200 response carrying an already-serialized JSON *body*."""
+    return httpx.Response(
+        200, content=body, headers={**_JSON_CONTENT_TYPE, **(headers or {})}
+    )
@@ -147,6 +147,18 @@ class TestAPIKeyAuthMiddleware:
         resp = client.get("/", headers={"Authorization": "Bearer other-key"})
         assert resp.status_code == 401
 
+    def test_single_key_set_rejects_missing_header(self):
+        client = _client_with_keys(frozenset({"only-key"}))
+        resp = client.get("/")
+        assert resp.status_code == 401
+        assert "Missing Authorization header" in resp.json()["error"]
+
+    def test_lifespan_scope_passes_through(self):
+        """Non-HTTP scopes (lifespan) reach the inner app without auth checks."""
+        with _client_with_keys(VALID_KEYS) as client:
+            resp = client.get("/", headers={"Authorization": "Bearer key-alpha"})
+            assert resp.status_code == 200
+
 
 # ---------------------------------------------------------------------------
 # Config parsing tests
@@ -252,6 +264,16 @@ class TestAuthLogging:
         assert len(auth_records) == 1
         assert "client=" in auth_records[0].message
 
+    def test_rejects_silently_when_warnings_disabled(
+        self, caplog: pytest.LogCaptureFixture
+    ):
+        """Auth still fails closed when the auth logger is above WARNING."""
+        client = _client_with_keys(VALID_KEYS)
+        with caplog.at_level(logging.ERROR, logger="levelang_mcp.auth"):
+            resp = client.get("/", headers={"Authorization": "Bearer bad-key"})
+        assert resp.status_code == 401
+        assert not any("Auth failed" in r.message for r in caplog.records)
+
     def test_no_log_on_health_check(self, caplog: pytest.LogCaptureFixture):
         """Health check requests should not produce auth log entries."""
         client = _client_with_keys(VALID_KEYS, include_health=True)
@@ -302,6 +324,35 @@ class TestConfigDefaults:
         s = get_settings()
         assert s.mcp_port == 8463
 
+    def test_languages_cache_ttl_defaults_to_300(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("LEVELANG_LANGUAGES_CACHE_TTL", raising=False)
+
+        from levelang_mcp.config import get_settings, reset_settings
+
+        reset_settings()
+        s = get_settings()
+        assert s.languages_cache_ttl_s == 300.0
+
+    def test_compare_concurrency_defaults_to_4(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.delenv("LEVELANG_COMPARE_CONCURRENCY", raising=False)
+
+        from levelang_mcp.config import get_settings, reset_settings
+
+        reset_settings()
+        s = get_settings()
+        assert s.translate_compare_concurrency == 4
+
+    def test_http_pool_limits_from_env(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("LEVELANG_HTTP_MAX_CONNECTIONS", "10")
+        monkeypatch.setenv("LEVELANG_HTTP_MAX_KEEPALIVE", "5")
+
+        from levelang_mcp.config import get_settings, reset_settings
+
+        reset_settings()
+        s = get_settings()
+        assert s.http_max_connections == 10
+        assert s.http_max_keepalive == 5
+
 
 # ---------------------------------------------------------------------------
 # Health endpoint response tests
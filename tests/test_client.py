@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 
 import httpx
+import orjson
 import pytest
+import pytest_asyncio
 import respx
 
 from sample_data import (
-    SAMPLE_LANGUAGES_RESPONSE,
-    SAMPLE_SINGLE_LANGUAGE,
-    SAMPLE_TRANSLATION_RESPONSE,
+    SAMPLE_LANGUAGES_RESPONSE_JSON,
+    SAMPLE_SINGLE_LANGUAGE_JSON,
+    SAMPLE_TRANSLATION_RESPONSE_JSON,
+    json_response,
 )
 
 from levelang_mcp.client import LevelangClient
@@ -20,25 +23,90 @@ from levelang_mcp.client import LevelangClient
 BASE_URL = "http://testserver/api/v1"
 
 
-@pytest.fixture
-def client(monkeypatch: pytest.MonkeyPatch):
-    """Create a LevelangClient with no API key (isolated from .env)."""
-    monkeypatch.delenv("LEVELANG_API_KEY", raising=False)
+def _build_client(**env: str) -> LevelangClient:
+    """Construct a LevelangClient against the test backend with *env* applied."""
     from levelang_mcp.config import reset_settings
 
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LEVELANG_API_BASE_URL", BASE_URL)
+        mp.delenv("LEVELANG_API_KEY", raising=False)
+        for name, value in env.items():
+            mp.setenv(name, value)
+        reset_settings()
+        c = LevelangClient()
     reset_settings()
+    return c
+
 
-    c = LevelangClient()
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _base_client():
+    """One LevelangClient with no API key, shared by the whole session."""
+    c = _build_client()
     yield c
+    await c.close()
 
-    reset_settings()
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _authed_base_client():
+    """One LevelangClient configured with a backend API key."""
+    c = _build_client(LEVELANG_API_KEY="sk_test_key_123")
+    yield c
+    await c.close()
+
+
+@pytest.fixture
+def client(_base_client: LevelangClient):
+    """The shared no-key client, with its language cache emptied."""
+    _base_client.clear_cache()
+    return _base_client
+
+
+@pytest.fixture
+def authed_client(_authed_base_client: LevelangClient):
+    """The shared API-key client, with its language cache emptied."""
+    _authed_base_client.clear_cache()
+    return _authed_base_client
+
+
+# Every backend endpoint the tests talk to, registered once per module.
+_BACKEND_ROUTES = (
+    ("POST", "/translate"),
+    ("GET", "/languages/details"),
+    ("GET", "/languages/fra"),
+    ("GET", "/languages/deu"),
+    ("GET", "/languages/xxx"),
+)
+
+
+@pytest.fixture(scope="module")
+def _respx_router():
+    """A respx router with all backend routes compiled up front."""
+    router = respx.mock(assert_all_called=False)
+    for method, path in _BACKEND_ROUTES:
+        router.route(method=method, url=f"{BASE_URL}{path}", name=path[1:])
+    with router:
+        yield router
+
+
+@pytest.fixture
+def backend(_respx_router: respx.MockRouter):
+    """The shared router; routes are named by path, e.g. ``backend["translate"]``.
+
+    Tests set responses with ``.mock(...)``; call history and responses are
+    cleared afterwards.
+    """
+    yield _respx_router
+    _respx_router.reset()
+    for route in _respx_router.routes:
+        route.mock(return_value=None, side_effect=None)
 
 
 class TestTranslate:
-    @respx.mock
-    async def test_translate_success(self, client: LevelangClient):
-        respx.post(f"{BASE_URL}/translate").mock(
-            return_value=httpx.Response(200, json=SAMPLE_TRANSLATION_RESPONSE)
+    async def test_translate_success(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["translate"].mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
         )
         result = await client.translate(
             text="Hello world",
@@ -50,10 +118,11 @@ class TestTranslate:
         assert result["translation"] == "Bonjour le monde"
         assert result["metadata"]["level"] == "A2"
 
-    @respx.mock
-    async def test_translate_sends_correct_body(self, client: LevelangClient):
-        route = respx.post(f"{BASE_URL}/translate").mock(
-            return_value=httpx.Response(200, json=SAMPLE_TRANSLATION_RESPONSE)
+    async def test_translate_sends_correct_body(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["translate"].mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
         )
         await client.translate(
             text="Test",
@@ -63,17 +132,19 @@ class TestTranslate:
             mood="formal",
         )
         request = route.calls[0].request
-        body = json.loads(request.content)
+        assert request.headers["Content-Type"] == "application/json"
+        body = orjson.loads(request.content)
         assert body["text"] == "Test"
         assert body["source_language_code"] == "eng"
         assert body["target_language_code"] == "deu"
         assert body["level"] == "advanced"
         assert body["mood"] == "formal"
 
-    @respx.mock
-    async def test_translate_sends_mode_when_provided(self, client: LevelangClient):
-        route = respx.post(f"{BASE_URL}/translate").mock(
-            return_value=httpx.Response(200, json=SAMPLE_TRANSLATION_RESPONSE)
+    async def test_translate_sends_mode_when_provided(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["translate"].mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
         )
         await client.translate(
             text="Test",
@@ -84,13 +155,14 @@ class TestTranslate:
             mode="spoken",
         )
         request = route.calls[0].request
-        body = json.loads(request.content)
+        body = orjson.loads(request.content)
         assert body["mode"] == "spoken"
 
-    @respx.mock
-    async def test_translate_omits_mode_when_none(self, client: LevelangClient):
-        route = respx.post(f"{BASE_URL}/translate").mock(
-            return_value=httpx.Response(200, json=SAMPLE_TRANSLATION_RESPONSE)
+    async def test_translate_omits_mode_when_none(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["translate"].mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
         )
         await client.translate(
             text="Test",
@@ -100,21 +172,23 @@ class TestTranslate:
             mood="casual",
         )
         request = route.calls[0].request
-        body = json.loads(request.content)
+        body = orjson.loads(request.content)
         assert "mode" not in body
 
-    @respx.mock
-    async def test_translate_422_raises(self, client: LevelangClient):
-        respx.post(f"{BASE_URL}/translate").mock(
+    async def test_translate_422_raises(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["translate"].mock(
             return_value=httpx.Response(422, json={"detail": "Invalid language code"})
         )
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
             await client.translate("Hi", "eng", "xxx", "beginner", "casual")
         assert exc_info.value.response.status_code == 422
 
-    @respx.mock
-    async def test_translate_500_raises(self, client: LevelangClient):
-        respx.post(f"{BASE_URL}/translate").mock(
+    async def test_translate_500_raises(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["translate"].mock(
             return_value=httpx.Response(500, text="Internal Server Error")
         )
         with pytest.raises(httpx.HTTPStatusError):
@@ -122,18 +196,20 @@ class TestTranslate:
 
 
 class TestGetLanguages:
-    @respx.mock
-    async def test_get_languages_success(self, client: LevelangClient):
-        respx.get(f"{BASE_URL}/languages/details").mock(
-            return_value=httpx.Response(200, json=SAMPLE_LANGUAGES_RESPONSE)
+    async def test_get_languages_success(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["languages/details"].mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
         )
         result = await client.get_languages()
         assert len(result["languages"]) == 2
         assert result["languages"][0]["code"] == "fra"
 
-    @respx.mock
-    async def test_get_languages_error(self, client: LevelangClient):
-        respx.get(f"{BASE_URL}/languages/details").mock(
+    async def test_get_languages_error(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["languages/details"].mock(
             return_value=httpx.Response(503, text="Service Unavailable")
         )
         with pytest.raises(httpx.HTTPStatusError):
@@ -141,18 +217,20 @@ class TestGetLanguages:
 
 
 class TestGetLanguage:
-    @respx.mock
-    async def test_get_language_success(self, client: LevelangClient):
-        respx.get(f"{BASE_URL}/languages/fra").mock(
-            return_value=httpx.Response(200, json=SAMPLE_SINGLE_LANGUAGE)
+    async def test_get_language_success(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["languages/fra"].mock(
+            return_value=json_response(SAMPLE_SINGLE_LANGUAGE_JSON)
         )
         result = await client.get_language("fra")
         assert result["code"] == "fra"
         assert result["name"] == "French"
 
-    @respx.mock
-    async def test_get_language_not_found(self, client: LevelangClient):
-        respx.get(f"{BASE_URL}/languages/xxx").mock(
+    async def test_get_language_not_found(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        backend["languages/xxx"].mock(
             return_value=httpx.Response(404, json={"detail": "Language not found"})
         )
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
@@ -160,26 +238,117 @@ class TestGetLanguage:
         assert exc_info.value.response.status_code == 404
 
 
+class TestLanguageCache:
+    async def test_fresh_entry_served_from_cache(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["languages/details"].mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
+        )
+        first = await client.get_languages()
+        second = await client.get_languages()
+        assert second == first
+        assert route.call_count == 1
+
+    async def test_cache_keyed_by_language_code(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        fra = backend["languages/fra"].mock(
+            return_value=json_response(SAMPLE_SINGLE_LANGUAGE_JSON)
+        )
+        deu = backend["languages/deu"].mock(
+            return_value=json_response(SAMPLE_SINGLE_LANGUAGE_JSON)
+        )
+        await client.get_language("fra")
+        await client.get_language("deu")
+        await client.get_language("fra")
+        assert fra.call_count == 1
+        assert deu.call_count == 1
+
+    async def test_expired_entry_revalidated_with_etag(self, backend: respx.MockRouter):
+        route = backend["languages/details"].mock(
+            side_effect=[
+                json_response(SAMPLE_LANGUAGES_RESPONSE_JSON, headers={"ETag": '"v1"'}),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        async with _build_client(LEVELANG_LANGUAGES_CACHE_TTL="0") as client:
+            first = await client.get_languages()
+            second = await client.get_languages()
+        assert second == first
+        assert route.call_count == 2
+        assert "If-None-Match" not in route.calls[0].request.headers
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+
+    async def test_errors_are_not_cached(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["languages/details"].mock(
+            side_effect=[
+                httpx.Response(503, text="Service Unavailable"),
+                json_response(SAMPLE_LANGUAGES_RESPONSE_JSON),
+            ]
+        )
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_languages()
+        result = await client.get_languages()
+        assert len(result["languages"]) == 2
+        assert route.call_count == 2
+
+    async def test_concurrent_misses_share_one_request(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        async def _slow_response(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return json_response(SAMPLE_SINGLE_LANGUAGE_JSON)
+
+        route = backend["languages/fra"].mock(side_effect=_slow_response)
+        results = await asyncio.gather(*(client.get_language("fra") for _ in range(5)))
+        assert route.call_count == 1
+        assert all(r == results[0] for r in results)
+
+    async def test_concurrent_misses_share_errors(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        async def _slow_error(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            return httpx.Response(404, text="Not Found")
+
+        route = backend["languages/xxx"].mock(side_effect=_slow_error)
+        outcomes = await asyncio.gather(
+            *(client.get_language("xxx") for _ in range(3)), return_exceptions=True
+        )
+        assert route.call_count == 1
+        assert all(isinstance(o, httpx.HTTPStatusError) for o in outcomes)
+
+    async def test_clear_cache_forces_refetch(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["languages/details"].mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
+        )
+        await client.get_languages()
+        client.clear_cache()
+        await client.get_languages()
+        assert route.call_count == 2
+
+
 class TestAuthHeaders:
-    @respx.mock
-    async def test_no_auth_header_when_no_key(self, client: LevelangClient):
-        route = respx.get(f"{BASE_URL}/languages/details").mock(
-            return_value=httpx.Response(200, json=SAMPLE_LANGUAGES_RESPONSE)
+    async def test_no_auth_header_when_no_key(
+        self, client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["languages/details"].mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
         )
         await client.get_languages()
         request = route.calls[0].request
         assert "Authorization" not in request.headers
 
-    @respx.mock
-    async def test_auth_header_when_key_set(self, monkeypatch: pytest.MonkeyPatch):
-        monkeypatch.setenv("LEVELANG_API_KEY", "sk_test_key_123")
-        from levelang_mcp.config import reset_settings
-
-        reset_settings()
-
-        authed_client = LevelangClient()
-        route = respx.get(f"{BASE_URL}/languages/details").mock(
-            return_value=httpx.Response(200, json=SAMPLE_LANGUAGES_RESPONSE)
+    async def test_auth_header_when_key_set(
+        self, authed_client: LevelangClient, backend: respx.MockRouter
+    ):
+        route = backend["languages/details"].mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
         )
         await authed_client.get_languages()
         request = route.calls[0].request
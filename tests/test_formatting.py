@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import pytest
+
 from sample_data import (
     SAMPLE_LANGUAGES_RESPONSE,
     SAMPLE_SINGLE_LANGUAGE,
     SAMPLE_TRANSLATION_RESPONSE,
+    SAMPLE_TRANSLATION_RESPONSE_WITH_TRANSCRIPTION,
     SAMPLE_TRANSLATION_WITH_TRANSLIT,
 )
 
@@ -17,38 +20,49 @@ from levelang_mcp.formatting import (
 )
 
 
+# Each formatter is deterministic, so the shared sample payloads are
+# formatted once per test class rather than once per test.
+
+
+@pytest.fixture(scope="class")
+def formatted_translation() -> str:
+    return format_translation(SAMPLE_TRANSLATION_RESPONSE)
+
+
+@pytest.fixture(scope="class")
+def formatted_language_list() -> str:
+    return format_language_list(SAMPLE_LANGUAGES_RESPONSE)
+
+
+@pytest.fixture(scope="class")
+def formatted_language_detail() -> str:
+    return format_language_detail(SAMPLE_SINGLE_LANGUAGE)
+
+
 class TestFormatTranslation:
-    def test_basic_translation(self):
-        result = format_translation(SAMPLE_TRANSLATION_RESPONSE)
-        assert "Translation: Bonjour le monde" in result
-        assert "Level: A2 (elementary proficiency)" in result
-        assert "Mood: Casual" in result
-        assert "Provider: gemini / gemini-2.5-flash-lite" in result
-        assert "Processing time: 800ms" in result
-
-    def test_transliteration_omitted_when_null(self):
-        result = format_translation(SAMPLE_TRANSLATION_RESPONSE)
-        assert "Transliteration" not in result
+    def test_basic_translation(self, formatted_translation: str):
+        assert "Translation: Bonjour le monde" in formatted_translation
+        assert "Level: A2 (elementary proficiency)" in formatted_translation
+        assert "Mood: Casual" in formatted_translation
+        assert "Provider: gemini / gemini-2.5-flash-lite" in formatted_translation
+        assert "Processing time: 800ms" in formatted_translation
+
+    def test_transliteration_omitted_when_null(self, formatted_translation: str):
+        assert "Transliteration" not in formatted_translation
 
     def test_transliteration_included_when_present(self):
         result = format_translation(SAMPLE_TRANSLATION_WITH_TRANSLIT)
         assert "Transliteration: n\u01d0 h\u01ceo sh\u00ec ji\u00e8" in result
 
-    def test_transcription_omitted_when_null(self):
-        result = format_translation(SAMPLE_TRANSLATION_RESPONSE)
-        assert "Transcription" not in result
+    def test_transcription_omitted_when_null(self, formatted_translation: str):
+        assert "Transcription" not in formatted_translation
 
     def test_transcription_included_when_present(self):
-        response = {
-            **SAMPLE_TRANSLATION_RESPONSE,
-            "transcription": "Hello world",
-        }
-        result = format_translation(response)
+        result = format_translation(SAMPLE_TRANSLATION_RESPONSE_WITH_TRANSCRIPTION)
         assert "Transcription: Hello world" in result
 
-    def test_mode_included_when_present(self):
-        result = format_translation(SAMPLE_TRANSLATION_RESPONSE)
-        assert "Mode: Written" in result
+    def test_mode_included_when_present(self, formatted_translation: str):
+        assert "Mode: Written" in formatted_translation
 
     def test_mode_omitted_when_absent(self):
         response = {
@@ -75,28 +89,23 @@ class TestFormatTranslation:
 
 
 class TestFormatLanguageList:
-    def test_formats_multiple_languages(self):
-        result = format_language_list(SAMPLE_LANGUAGES_RESPONSE)
-        assert "French (fra)" in result
-        assert "Mandarin Chinese (cmn)" in result
+    def test_formats_multiple_languages(self, formatted_language_list: str):
+        assert "French (fra)" in formatted_language_list
+        assert "Mandarin Chinese (cmn)" in formatted_language_list
 
-    def test_shows_levels(self):
-        result = format_language_list(SAMPLE_LANGUAGES_RESPONSE)
-        assert "Beginner, Intermediate, Advanced, Fluent" in result
+    def test_shows_levels(self, formatted_language_list: str):
+        assert "Beginner, Intermediate, Advanced, Fluent" in formatted_language_list
 
-    def test_shows_moods(self):
-        result = format_language_list(SAMPLE_LANGUAGES_RESPONSE)
-        assert "Casual, Polite, Formal" in result
+    def test_shows_moods(self, formatted_language_list: str):
+        assert "Casual, Polite, Formal" in formatted_language_list
 
-    def test_shows_modes(self):
-        result = format_language_list(SAMPLE_LANGUAGES_RESPONSE)
-        assert "Modes: Written, Spoken" in result
+    def test_shows_modes(self, formatted_language_list: str):
+        assert "Modes: Written, Spoken" in formatted_language_list
 
-    def test_omits_modes_when_empty(self):
-        result = format_language_list(SAMPLE_LANGUAGES_RESPONSE)
+    def test_omits_modes_when_empty(self, formatted_language_list: str):
         # Mandarin has empty modes list -- should not show a Modes line
-        cmn_section = result.split("Mandarin Chinese (cmn)")[1]
-        assert "Modes:" not in cmn_section
+        cmn_start = formatted_language_list.index("Mandarin Chinese (cmn)")
+        assert "Modes:" not in formatted_language_list[cmn_start:]
 
     def test_empty_languages(self):
         result = format_language_list({"languages": [], "total_count": 0})
@@ -104,38 +113,33 @@ class TestFormatLanguageList:
 
 
 class TestFormatLanguageDetail:
-    def test_header(self):
-        result = format_language_detail(SAMPLE_SINGLE_LANGUAGE)
-        assert result.startswith("French (fra)")
-
-    def test_levels_with_descriptions(self):
-        result = format_language_detail(SAMPLE_SINGLE_LANGUAGE)
-        assert "Beginner: Basic vocabulary" in result
-        assert "Intermediate: Complex structures" in result
-
-    def test_moods_with_default_marker(self):
-        result = format_language_detail(SAMPLE_SINGLE_LANGUAGE)
-        assert "Casual (default): Everyday conversation" in result
-        assert "Formal: Professional contexts" in result
+    def test_header(self, formatted_language_detail: str):
+        assert formatted_language_detail.startswith("French (fra)")
+
+    def test_levels_with_descriptions(self, formatted_language_detail: str):
+        assert "Beginner: Basic vocabulary" in formatted_language_detail
+        assert "Intermediate: Complex structures" in formatted_language_detail
+
+    def test_moods_with_default_marker(self, formatted_language_detail: str):
+        assert "Casual (default): Everyday conversation" in formatted_language_detail
+        assert "Formal: Professional contexts" in formatted_language_detail
         # Formal should NOT have default marker
-        assert "Formal (default)" not in result
+        assert "Formal (default)" not in formatted_language_detail
 
-    def test_modes_with_default_marker(self):
-        result = format_language_detail(SAMPLE_SINGLE_LANGUAGE)
+    def test_modes_with_default_marker(self, formatted_language_detail: str):
         assert (
             "Written (default): Standard written French as taught in textbooks"
-            in result
+            in formatted_language_detail
         )
         assert (
             "Spoken: How native French speakers actually talk in everyday conversation"
-            in result
+            in formatted_language_detail
         )
         # Spoken should NOT have default marker
-        assert "Spoken (default)" not in result
+        assert "Spoken (default)" not in formatted_language_detail
 
-    def test_can_be_used_as(self):
-        result = format_language_detail(SAMPLE_SINGLE_LANGUAGE)
-        assert "Can be used as: target" in result
+    def test_can_be_used_as(self, formatted_language_detail: str):
+        assert "Can be used as: target" in formatted_language_detail
 
 
 class TestFormatComparison:
@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import logging
 
-from levelang_mcp.logging_config import JSONFormatter, setup_logging
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+
+from levelang_mcp.logging_config import (
+    JSONFormatter,
+    _iso_utc,
+    _stop_listener,
+    setup_logging,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -13,76 +25,119 @@ from levelang_mcp.logging_config import JSONFormatter, setup_logging
 # ---------------------------------------------------------------------------
 
 
-class TestJSONFormatter:
-    def _make_record(
-        self,
+RecordFactory = Callable[..., logging.LogRecord]
+
+
+@pytest.fixture(scope="class")
+def record_prototype() -> logging.LogRecord:
+    """One fully built LogRecord; tests get shallow copies of it."""
+    return logging.makeLogRecord(
+        {
+            "name": "test.logger",
+            "levelno": logging.INFO,
+            "levelname": "INFO",
+            "pathname": "test.py",
+            "lineno": 1,
+            "msg": "hello",
+        }
+    )
+
+
+@pytest.fixture
+def make_record(record_prototype: logging.LogRecord) -> RecordFactory:
+    def _make(
         message: str = "hello",
         level: int = logging.INFO,
         name: str = "test.logger",
     ) -> logging.LogRecord:
-        return logging.LogRecord(
-            name=name,
-            level=level,
-            pathname="test.py",
-            lineno=1,
-            msg=message,
-            args=(),
-            exc_info=None,
-        )
-
-    def test_output_is_valid_json(self):
+        record = copy.copy(record_prototype)
+        record.msg = message
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+        record.name = name
+        record.exc_info = None
+        return record
+
+    return _make
+
+
+class TestJSONFormatter:
+    def test_output_is_valid_json(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record()
+        record = make_record()
         output = fmt.format(record)
-        parsed = json.loads(output)
+        parsed = orjson.loads(output)
         assert isinstance(parsed, dict)
 
-    def test_contains_required_fields(self):
+    def test_contains_required_fields(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record(message="test msg", name="my.logger")
-        parsed = json.loads(fmt.format(record))
+        record = make_record(message="test msg", name="my.logger")
+        parsed = orjson.loads(fmt.format(record))
         assert parsed["message"] == "test msg"
         assert parsed["logger"] == "my.logger"
         assert parsed["level"] == "INFO"
         assert "timestamp" in parsed
 
-    def test_timestamp_is_utc_iso8601(self):
+    def test_timestamp_is_utc_iso8601(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record()
-        parsed = json.loads(fmt.format(record))
+        record = make_record()
+        parsed = orjson.loads(fmt.format(record))
         ts = parsed["timestamp"]
         # ISO 8601 with UTC offset
         assert ts.endswith(("+00:00", "Z"))
 
-    def test_includes_exception_info(self):
+    @pytest.mark.parametrize(
+        "created",
+        [
+            pytest.param(1_767_225_600.123456, id="fractional"),
+            pytest.param(1_767_225_600.0, id="whole-second"),
+        ],
+    )
+    def test_timestamp_matches_datetime_isoformat(self, created: float):
+        expected = datetime.fromtimestamp(created, tz=UTC).isoformat()
+        assert _iso_utc(created) == expected
+
+    def test_non_ascii_written_as_utf8(self, make_record: RecordFactory):
+        fmt = JSONFormatter()
+        output = fmt.format(make_record(message="shutting down \u2014 bye"))
+        assert "shutting down \u2014 bye" in output
+        assert "\\u2014" not in output
+
+    def test_lone_surrogate_falls_back_to_escaping(self, make_record: RecordFactory):
+        fmt = JSONFormatter()
+        output = fmt.format(make_record(message="bad \ud800 text"))
+        assert "\\ud800" in output
+        assert json.loads(output)["message"] == "bad \ud800 text"
+
+    def test_includes_exception_info(self, make_record: RecordFactory):
         fmt = JSONFormatter()
         try:
             raise ValueError("boom")
         except ValueError:
             import sys
 
-            record = self._make_record()
+            record = make_record()
             record.exc_info = sys.exc_info()
-        output = json.loads(fmt.format(record))
+        output = orjson.loads(fmt.format(record))
         assert "exception" in output
         assert "ValueError" in output["exception"]
         assert "boom" in output["exception"]
 
-    def test_no_exception_key_when_no_error(self):
+    def test_no_exception_key_when_no_error(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record()
-        output = json.loads(fmt.format(record))
+        record = make_record()
+        output = orjson.loads(fmt.format(record))
         assert "exception" not in output
 
-    def test_respects_log_level(self):
+    def test_respects_log_level(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record(level=logging.WARNING)
-        parsed = json.loads(fmt.format(record))
+        record = make_record(level=logging.WARNING)
+        parsed = orjson.loads(fmt.format(record))
         assert parsed["level"] == "WARNING"
 
-    def test_single_line_output(self):
+    def test_single_line_output(self, make_record: RecordFactory):
         fmt = JSONFormatter()
-        record = self._make_record(message="line one\nline two")
+        record = make_record(message="line one\nline two")
         output = fmt.format(record)
         # The JSON itself should be a single line (no embedded newlines
         # outside of string values).
@@ -95,62 +150,84 @@ class TestJSONFormatter:
 
 
 class TestSetupLogging:
-    def _cleanup_logger(self) -> None:
-        """Remove handlers added by setup_logging."""
+    @staticmethod
+    def _stream_formatter() -> logging.Formatter | None:
+        """Formatter of the stream handler behind the package's queue."""
         pkg_logger = logging.getLogger("levelang_mcp")
-        pkg_logger.handlers.clear()
-        pkg_logger.propagate = True
-        pkg_logger.setLevel(logging.WARNING)
+        listener = pkg_logger.handlers[0].listener
+        return listener.handlers[0].formatter
 
-    def test_json_format_uses_json_formatter(self):
-        try:
-            setup_logging(log_level="DEBUG", log_format="json")
-            pkg_logger = logging.getLogger("levelang_mcp")
-            assert len(pkg_logger.handlers) == 1
-            assert isinstance(pkg_logger.handlers[0].formatter, JSONFormatter)
-        finally:
-            self._cleanup_logger()
-
-    def test_text_format_uses_standard_formatter(self):
-        try:
-            setup_logging(log_level="INFO", log_format="text")
-            pkg_logger = logging.getLogger("levelang_mcp")
-            assert len(pkg_logger.handlers) == 1
-            assert not isinstance(pkg_logger.handlers[0].formatter, JSONFormatter)
-        finally:
-            self._cleanup_logger()
-
-    def test_sets_log_level(self):
-        try:
-            setup_logging(log_level="DEBUG", log_format="text")
-            pkg_logger = logging.getLogger("levelang_mcp")
-            assert pkg_logger.level == logging.DEBUG
-        finally:
-            self._cleanup_logger()
+    @pytest.fixture(autouse=True)
+    def _restore_logger(self):
+        """Stop the listener and restore the package logger after each test."""
+        pkg_logger = logging.getLogger("levelang_mcp")
+        handlers = pkg_logger.handlers[:]
+        level = pkg_logger.level
+        propagate = pkg_logger.propagate
+        yield
+        _stop_listener()
+        pkg_logger.handlers = handlers
+        pkg_logger.setLevel(level)
+        pkg_logger.propagate = propagate
+
+    @pytest.mark.parametrize(
+        ("log_level", "log_format", "json_output", "expected_level"),
+        [
+            pytest.param("DEBUG", "json", True, logging.DEBUG, id="json"),
+            pytest.param("INFO", "text", False, logging.INFO, id="text"),
+            pytest.param("DEBUG", "text", False, logging.DEBUG, id="debug-level"),
+            pytest.param("WARNING", "text", False, logging.WARNING, id="warning-level"),
+            pytest.param("BANANA", "text", False, logging.INFO, id="invalid-level"),
+        ],
+    )
+    def test_configures_package_logger(
+        self,
+        log_level: str,
+        log_format: str,
+        json_output: bool,
+        expected_level: int,
+    ):
+        setup_logging(log_level=log_level, log_format=log_format)
+        pkg_logger = logging.getLogger("levelang_mcp")
+        assert len(pkg_logger.handlers) == 1
+        assert isinstance(self._stream_formatter(), JSONFormatter) is json_output
+        assert pkg_logger.level == expected_level
+        assert pkg_logger.propagate is False
 
     def test_child_loggers_inherit(self):
+        setup_logging(log_level="INFO", log_format="text")
+        child = logging.getLogger("levelang_mcp.auth")
+        # Child should inherit handlers via propagation being disabled
+        # on the parent — but the child itself should be able to log
+        # through the parent's handler.
+        assert child.getEffectiveLevel() == logging.INFO
+
+    def test_records_written_by_listener(self, capsys: pytest.CaptureFixture[str]):
+        setup_logging(log_level="INFO", log_format="json")
+        logging.getLogger("levelang_mcp.test").info("queued %s", "message")
+        _stop_listener()  # flushes the queue
+        line = capsys.readouterr().err.strip()
+        assert orjson.loads(line)["message"] == "queued message"
+
+    def test_exception_info_survives_queue(self, capsys: pytest.CaptureFixture[str]):
+        setup_logging(log_level="INFO", log_format="json")
         try:
-            setup_logging(log_level="INFO", log_format="text")
-            child = logging.getLogger("levelang_mcp.auth")
-            # Child should inherit handlers via propagation being disabled
-            # on the parent — but the child itself should be able to log
-            # through the parent's handler.
-            assert child.getEffectiveLevel() == logging.INFO
-        finally:
-            self._cleanup_logger()
-
-    def test_does_not_propagate_to_root(self):
-        try:
-            setup_logging(log_level="INFO", log_format="text")
-            pkg_logger = logging.getLogger("levelang_mcp")
-            assert pkg_logger.propagate is False
-        finally:
-            self._cleanup_logger()
-
-    def test_invalid_level_defaults_to_info(self):
-        try:
-            setup_logging(log_level="BANANA", log_format="text")
-            pkg_logger = logging.getLogger("levelang_mcp")
-            assert pkg_logger.level == logging.INFO
-        finally:
-            self._cleanup_logger()
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("levelang_mcp.test").exception("failed")
+        _stop_listener()
+        parsed = orjson.loads(capsys.readouterr().err.strip())
+        assert parsed["message"] == "failed"
+        assert "ValueError: boom" in parsed["exception"]
+
+    def test_reconfigure_replaces_listener(self, capsys: pytest.CaptureFixture[str]):
+        setup_logging(log_level="INFO", log_format="json")
+        first = logging.getLogger("levelang_mcp").handlers[0].listener
+        setup_logging(log_level="INFO", log_format="json")
+        second = logging.getLogger("levelang_mcp").handlers[0].listener
+        assert second is not first
+        assert first._thread is None  # stopped
+        logging.getLogger("levelang_mcp.test").info("after reconfigure")
+        _stop_listener()
+        parsed = orjson.loads(capsys.readouterr().err.strip())
+        assert parsed["message"] == "after reconfigure"
@@ -2,69 +2,219 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock
 
 import httpx
+import orjson
+import pytest
+import respx
 
-from sample_data import SAMPLE_LANGUAGES_RESPONSE, SAMPLE_TRANSLATION_RESPONSE
+from sample_data import (
+    SAMPLE_COMPARE_RESPONSES,
+    SAMPLE_FRENCH_LANGUAGE_META,
+    SAMPLE_LANGUAGES_RESPONSE_JSON,
+    SAMPLE_TRANSLATION_RESPONSE,
+    SAMPLE_TRANSLATION_RESPONSE_JSON,
+    json_response,
+)
 
+from levelang_mcp.client import LevelangClient
+from levelang_mcp.server import (
+    _sanitize_text,
+    compare_levels,
+    list_languages,
+    translate,
+    translate_compare,
+)
 
-class TestSanitizeText:
-    def test_strips_leading_trailing_whitespace(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert _sanitize_text("  Hello world  ") == "Hello world"
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        pytest.param("  Hello world  ", "Hello world", id="leading-trailing"),
+        pytest.param(
+            "Line one.\nLine two.\nLine three.",
+            "Line one.\nLine two.\nLine three.",
+            id="internal-newlines",
+        ),
+        pytest.param(
+            "I'm afraid I'll never understand",
+            "I'm afraid I'll never understand",
+            id="apostrophes",
+        ),
+        pytest.param("Héllo wörld café", "Héllo wörld café", id="unicode"),
+        pytest.param(
+            "\n\n  Hello world  \n\n", "Hello world", id="surrounding-newlines"
+        ),
+        pytest.param("Hello world\n", "Hello world", id="trailing-only"),
+        pytest.param("", "", id="empty"),
+        pytest.param("   \n\t  ", "", id="whitespace-only"),
+    ],
+)
+def test_sanitize_text(text: str, expected: str):
+    assert _sanitize_text(text) == expected
 
-    def test_preserves_internal_newlines(self):
-        from levelang_mcp.server import _sanitize_text
 
-        text = "Line one.\nLine two.\nLine three."
-        assert _sanitize_text(text) == text
+def test_sanitize_text_returns_clean_input_unchanged():
+    text = "Already clean.\nSecond line."
+    assert _sanitize_text(text) is text
 
-    def test_preserves_apostrophes(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert (
-            _sanitize_text("I'm afraid I'll never understand")
-            == "I'm afraid I'll never understand"
-        )
+# Backend requests/responses for the error-path tests, built once per module.
 
-    def test_preserves_unicode(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert _sanitize_text("Héllo wörld café") == "Héllo wörld café"
+@pytest.fixture(scope="module")
+def post_request() -> httpx.Request:
+    return httpx.Request("POST", "http://test")
 
-    def test_strips_surrounding_newlines(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert _sanitize_text("\n\n  Hello world  \n\n") == "Hello world"
+@pytest.fixture(scope="module")
+def get_request() -> httpx.Request:
+    return httpx.Request("GET", "http://test")
 
-    def test_empty_string(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert _sanitize_text("") == ""
+@pytest.fixture(scope="module")
+def post_422(post_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        422, json={"detail": "Invalid language code"}, request=post_request
+    )
 
-    def test_whitespace_only(self):
-        from levelang_mcp.server import _sanitize_text
 
-        assert _sanitize_text("   \n\t  ") == ""
+@pytest.fixture(scope="module")
+def post_422_text(post_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(422, text="Unprocessable Entity", request=post_request)
 
 
-class TestTranslateTool:
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_returns_formatted_string(self, mock_client):
-        mock_client.translate = AsyncMock(return_value=SAMPLE_TRANSLATION_RESPONSE)
-        from levelang_mcp.server import translate
+@pytest.fixture(scope="module")
+def post_429(post_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(429, text="Too Many Requests", request=post_request)
+
+
+@pytest.fixture(scope="module")
+def post_500(post_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(500, text="Internal Server Error", request=post_request)
+
+
+@pytest.fixture(scope="module")
+def get_429(get_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(429, text="Too Many Requests", request=get_request)
+
+
+@pytest.fixture(scope="module")
+def get_500(get_request: httpx.Request) -> httpx.Response:
+    return httpx.Response(500, text="Internal Server Error", request=get_request)
+
+
+def _status_error(response: httpx.Response) -> httpx.HTTPStatusError:
+    return httpx.HTTPStatusError("", request=response.request, response=response)
+
+
+def _french_meta(*codes: str) -> dict[str, Any]:
+    """The French language config, keeping only the levels in *codes*."""
+    return {
+        **SAMPLE_FRENCH_LANGUAGE_META,
+        "levels": [
+            lv for lv in SAMPLE_FRENCH_LANGUAGE_META["levels"] if lv["code"] in codes
+        ],
+    }
+
+
+def _async_raise(exc: Exception) -> Callable[..., Awaitable[Any]]:
+    """A bare coroutine function that raises *exc*.
+
+    For error-path tests that never inspect the call, where AsyncMock's
+    call bookkeeping isn't needed.
+    """
+
+    async def _raise(*args: Any, **kwargs: Any) -> Any:
+        raise exc
+
+    return _raise
+
+
+def _translate_mock(*outcomes: Any) -> AsyncMock:
+    """A translate mock returning (or raising) *outcomes* in call order."""
+    return AsyncMock(side_effect=outcomes)
 
+
+@pytest.fixture
+def levelang_mock(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace the server's backend client with a mock for one test."""
+    mock = AsyncMock()
+    monkeypatch.setattr("levelang_mcp.server.levelang", mock)
+    return mock
+
+
+class _ConcurrencyProbe:
+    """A slow translate stand-in that records the peak number of calls in flight."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+
+    async def translate(self, **kwargs: Any) -> dict[str, Any]:
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return {"translation": "Bonjour", "transliteration": None, "metadata": {}}
+
+
+@pytest.fixture
+def slow_translate(levelang_mock: AsyncMock) -> _ConcurrencyProbe:
+    """Make the mocked backend's translate slow and track its concurrency."""
+    probe = _ConcurrencyProbe()
+    levelang_mock.translate = AsyncMock(side_effect=probe.translate)
+    return probe
+
+
+@pytest.fixture
+async def backend(monkeypatch: pytest.MonkeyPatch):
+    """Serve the server's backend client from a respx router.
+
+    The client is real, but its transport hands requests straight to the
+    router, so no network transport or connection pool is created.
+    """
+    router = respx.MockRouter(
+        base_url="http://testserver/api/v1", assert_all_called=False
+    )
+    client = LevelangClient(transport=httpx.MockTransport(router.async_handler))
+    monkeypatch.setattr("levelang_mcp.server.levelang", client)
+    yield router
+    await client.close()
+
+
+@pytest.fixture
+def new_http_clients(
+    backend: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> list[httpx.AsyncClient]:
+    """Every httpx.AsyncClient constructed after the backend client."""
+    created: list[httpx.AsyncClient] = []
+    original_init = httpx.AsyncClient.__init__
+
+    def _recording_init(self: httpx.AsyncClient, *args, **kwargs) -> None:
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(httpx.AsyncClient, "__init__", _recording_init)
+    return created
+
+
+class TestTranslateTool:
+    async def test_translate_returns_formatted_string(self, backend: respx.MockRouter):
+        backend.post("/translate").mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
+        )
         result = await translate("Hello world", "fra", "beginner")
         assert "Translation: Bonjour le monde" in result
         assert "Level: A2" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_maps_field_names(self, mock_client):
-        mock_client.translate = AsyncMock(return_value=SAMPLE_TRANSLATION_RESPONSE)
-        from levelang_mcp.server import translate
-
+    async def test_translate_maps_field_names(self, levelang_mock):
+        levelang_mock.translate.return_value = SAMPLE_TRANSLATION_RESPONSE
         await translate(
             text="Hello",
             target_language="deu",
@@ -73,7 +223,7 @@ class TestTranslateTool:
             mood="formal",
             mode="spoken",
         )
-        mock_client.translate.assert_called_once_with(
+        levelang_mock.translate.assert_awaited_once_with(
             text="Hello",
             source_language_code="eng",
             target_language_code="deu",
@@ -83,293 +233,186 @@ class TestTranslateTool:
             model=None,
         )
 
-    @patch("levelang_mcp.server.levelang")
     async def test_translate_strips_whitespace_but_preserves_newlines(
-        self, mock_client
+        self, levelang_mock
     ):
-        mock_client.translate = AsyncMock(return_value=SAMPLE_TRANSLATION_RESPONSE)
-        from levelang_mcp.server import translate
-
+        levelang_mock.translate.return_value = SAMPLE_TRANSLATION_RESPONSE
         await translate(
             text="  Line one.\nLine two.  ",
             target_language="fra",
             level="beginner",
         )
         # Verify leading/trailing whitespace stripped but internal newlines preserved
-        call_kwargs = mock_client.translate.call_args.kwargs
+        call_kwargs = levelang_mock.translate.call_args.kwargs
         assert call_kwargs["text"] == "Line one.\nLine two."
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_handles_422(self, mock_client):
-        response = httpx.Response(
-            422,
-            json={"detail": "Invalid language code"},
-            request=httpx.Request("POST", "http://test"),
-        )
-        mock_client.translate = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "", response=response, request=response.request
-            )
-        )
-        from levelang_mcp.server import translate
-
-        result = await translate("Hello", "xxx", "beginner")
-        assert "Invalid request" in result
-        assert "Invalid language code" in result
-
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_handles_429(self, mock_client):
-        response = httpx.Response(
-            429, text="Too Many Requests", request=httpx.Request("POST", "http://test")
-        )
-        mock_client.translate = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "", response=response, request=response.request
-            )
-        )
-        from levelang_mcp.server import translate
-
-        result = await translate("Hello", "fra", "beginner")
-        assert "Rate limit" in result
-
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_handles_500(self, mock_client):
-        response = httpx.Response(
-            500,
-            text="Internal Server Error",
-            request=httpx.Request("POST", "http://test"),
-        )
-        mock_client.translate = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "", response=response, request=response.request
-            )
-        )
-        from levelang_mcp.server import translate
-
-        result = await translate("Hello", "fra", "beginner")
-        assert "temporarily unavailable" in result
-
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_handles_timeout(self, mock_client):
-        mock_client.translate = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
-        from levelang_mcp.server import translate
-
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            # Strings name a module-scoped backend response fixture.
+            pytest.param(
+                "post_422", "Invalid request: Invalid language code", id="422"
+            ),
+            pytest.param(
+                "post_422_text",
+                "Invalid request: Unprocessable Entity",
+                id="422-non-json",
+            ),
+            pytest.param("post_429", "Rate limit", id="429"),
+            pytest.param("post_500", "temporarily unavailable", id="500"),
+            pytest.param(httpx.TimeoutException("timeout"), "timed out", id="timeout"),
+            pytest.param(httpx.ReadTimeout("slow"), "timed out", id="timeout-subclass"),
+            pytest.param(httpx.ConnectError("refused"), "Cannot reach", id="connect"),
+        ],
+    )
+    async def test_translate_reports_backend_errors(
+        self,
+        levelang_mock,
+        request: pytest.FixtureRequest,
+        error: str | Exception,
+        expected: str,
+    ):
+        if isinstance(error, str):
+            error = _status_error(request.getfixturevalue(error))
+        levelang_mock.translate = _async_raise(error)
         result = await translate("Hello", "fra", "beginner")
-        assert "timed out" in result
-
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_handles_connection_error(self, mock_client):
-        mock_client.translate = AsyncMock(side_effect=httpx.ConnectError("refused"))
-        from levelang_mcp.server import translate
+        assert expected in result
 
+    async def test_translate_handles_unexpected_error(self, levelang_mock):
+        levelang_mock.translate = _async_raise(RuntimeError("kaboom"))
         result = await translate("Hello", "fra", "beginner")
-        assert "Cannot reach" in result
+        assert result == "Unexpected error: kaboom"
 
 
 class TestListLanguagesTool:
-    @patch("levelang_mcp.server.levelang")
-    async def test_list_languages_returns_formatted_string(self, mock_client):
-        mock_client.get_languages = AsyncMock(return_value=SAMPLE_LANGUAGES_RESPONSE)
-        from levelang_mcp.server import list_languages
-
+    async def test_list_languages_returns_formatted_string(
+        self, backend: respx.MockRouter
+    ):
+        backend.get("/languages/details").mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
+        )
         result = await list_languages()
         assert "French (fra)" in result
         assert "Mandarin Chinese (cmn)" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_list_languages_handles_connection_error(self, mock_client):
-        mock_client.get_languages = AsyncMock(side_effect=httpx.ConnectError("refused"))
-        from levelang_mcp.server import list_languages
-
+    async def test_list_languages_handles_connection_error(self, levelang_mock):
+        levelang_mock.get_languages = _async_raise(httpx.ConnectError("refused"))
         result = await list_languages()
         assert "Cannot reach" in result
 
+    async def test_list_languages_handles_429(self, levelang_mock, get_429):
+        levelang_mock.get_languages = _async_raise(_status_error(get_429))
+        result = await list_languages()
+        assert "Rate limit" in result
+
+    async def test_list_languages_handles_500(self, levelang_mock, get_500):
+        levelang_mock.get_languages = _async_raise(_status_error(get_500))
+        result = await list_languages()
+        assert "temporarily unavailable" in result
+
 
 class TestTranslateCompareTool:
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_returns_all_levels(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                    {"code": "intermediate", "display_name": "Intermediate"},
-                    {"code": "advanced", "display_name": "Advanced"},
-                ],
-                "moods": [{"code": "casual", "display_name": "Casual"}],
-            }
-        )
-        mock_client.translate = AsyncMock(
-            side_effect=[
-                {
-                    "translation": "Bonjour",
-                    "transliteration": None,
-                    "metadata": {"processing_time_ms": 800},
-                },
-                {
-                    "translation": "Bonjour, comment allez-vous",
-                    "transliteration": None,
-                    "metadata": {"processing_time_ms": 900},
-                },
-                {
-                    "translation": "Bonjour, comment vous portez-vous aujourd'hui",
-                    "transliteration": None,
-                    "metadata": {"processing_time_ms": 1000},
-                },
-            ]
+    async def test_translate_compare_returns_all_levels(
+        self, backend: respx.MockRouter
+    ):
+        levels = ("beginner", "intermediate", "advanced")
+        backend.get("/languages/fra").mock(
+            return_value=json_response(
+                orjson.dumps(_french_meta(*levels), default=dict)
+            )
         )
-        from levelang_mcp.server import translate_compare
+        responses = dict(zip(levels, SAMPLE_COMPARE_RESPONSES, strict=True))
+
+        # Levels are translated concurrently, so answer by the requested
+        # level rather than by arrival order.
+        def _translate(request: httpx.Request) -> httpx.Response:
+            level = orjson.loads(request.content)["level"]
+            return json_response(orjson.dumps(responses[level], default=dict))
 
+        translate_route = backend.post("/translate").mock(side_effect=_translate)
         result = await translate_compare("Hello", "fra")
         assert "Beginner" in result
         assert "Intermediate" in result
         assert "Advanced" in result
-        assert "Bonjour" in result
-        assert mock_client.translate.call_count == 3
-
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_unknown_language(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Not Found",
-                request=httpx.Request("GET", "http://test/languages/xxx"),
-                response=httpx.Response(404),
-            )
-        )
-        from levelang_mcp.server import translate_compare
+        for response in SAMPLE_COMPARE_RESPONSES:
+            assert response["translation"] in result
+        assert translate_route.call_count == 3
 
+    async def test_translate_compare_unknown_language(self, backend: respx.MockRouter):
+        backend.get("/languages/xxx").mock(return_value=httpx.Response(404))
         result = await translate_compare("Hello", "xxx")
         assert "not found" in result.lower()
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_partial_failure(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                    {"code": "advanced", "display_name": "Advanced"},
-                ],
-                "moods": [],
-            }
+    async def test_translate_compare_partial_failure(self, levelang_mock):
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "advanced")
         )
-        mock_client.translate = AsyncMock(
-            side_effect=[
-                {"translation": "Bonjour", "transliteration": None, "metadata": {}},
-                Exception("Provider timeout"),
-            ]
+        levelang_mock.translate = _translate_mock(
+            SAMPLE_COMPARE_RESPONSES[0], Exception("Provider timeout")
         )
-        from levelang_mcp.server import translate_compare
-
         result = await translate_compare("Hello", "fra")
         assert "Beginner" in result
         assert "Bonjour" in result
         assert "Advanced" in result
         assert "Error" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_connection_error(self, mock_client):
-        mock_client.get_language = AsyncMock(side_effect=httpx.ConnectError("refused"))
-        from levelang_mcp.server import translate_compare
+    async def test_translate_compare_partial_failure_messages(
+        self, levelang_mock, post_429, post_500
+    ):
+        """Failed levels reuse the tool-level wording for backend errors."""
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "intermediate", "advanced")
+        )
+        levelang_mock.translate = _translate_mock(
+            _status_error(post_429),
+            _status_error(post_500),
+            httpx.ReadTimeout("slow"),
+        )
+        result = await translate_compare("Hello", "fra")
+        assert "Error: Rate limit reached." in result
+        assert "Error: Backend error (HTTP 500): Internal Server Error" in result
+        assert "Error: Request timed out." in result
 
+    async def test_translate_compare_connection_error(self, levelang_mock):
+        levelang_mock.get_language = _async_raise(httpx.ConnectError("refused"))
         result = await translate_compare("Hello", "fra")
         assert "Cannot reach" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_timeout(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            side_effect=httpx.TimeoutException("timeout")
-        )
-        from levelang_mcp.server import translate_compare
-
+    async def test_translate_compare_timeout(self, levelang_mock):
+        levelang_mock.get_language = _async_raise(httpx.TimeoutException("timeout"))
         result = await translate_compare("Hello", "fra")
         assert "timed out" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_generic_http_error(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            side_effect=httpx.HTTPStatusError(
-                "Server Error",
-                request=httpx.Request("GET", "http://test/languages/fra"),
-                response=httpx.Response(500, text="Internal Server Error"),
-            )
-        )
-        from levelang_mcp.server import translate_compare
-
+    async def test_translate_compare_generic_http_error(self, levelang_mock, get_500):
+        levelang_mock.get_language = _async_raise(_status_error(get_500))
         result = await translate_compare("Hello", "fra")
         assert "Backend error (HTTP 500)" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_empty_levels(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [],
-                "moods": [],
-            }
-        )
-        from levelang_mcp.server import translate_compare
-
+    async def test_translate_compare_empty_levels(self, levelang_mock):
+        levelang_mock.get_language = AsyncMock(return_value=_french_meta())
         result = await translate_compare("Hello", "fra")
         assert "No proficiency levels" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_sanitizes_input(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [{"code": "beginner", "display_name": "Beginner"}],
-                "moods": [],
-            }
-        )
-        mock_client.translate = AsyncMock(
+    async def test_translate_compare_sanitizes_input(self, levelang_mock):
+        levelang_mock.get_language = AsyncMock(return_value=_french_meta("beginner"))
+        levelang_mock.translate = AsyncMock(
             return_value={
                 "translation": "Bonjour",
                 "transliteration": None,
                 "metadata": {},
             }
         )
-        from levelang_mcp.server import translate_compare
-
         await translate_compare("  Hello  ", "fra")
-        call_kwargs = mock_client.translate.call_args.kwargs
+        call_kwargs = levelang_mock.translate.call_args.kwargs
         assert call_kwargs["text"] == "Hello"
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_subset_of_levels(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                    {"code": "intermediate", "display_name": "Intermediate"},
-                    {"code": "advanced", "display_name": "Advanced"},
-                    {"code": "fluent", "display_name": "Fluent"},
-                ],
-                "moods": [{"code": "casual", "display_name": "Casual"}],
-            }
+    async def test_translate_compare_subset_of_levels(self, levelang_mock):
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "intermediate", "advanced", "fluent")
         )
-        mock_client.translate = AsyncMock(
-            side_effect=[
-                {
-                    "translation": "Bonjour",
-                    "transliteration": None,
-                    "metadata": {"processing_time_ms": 800},
-                },
-                {
-                    "translation": "Bonjour, comment vous portez-vous aujourd'hui",
-                    "transliteration": None,
-                    "metadata": {"processing_time_ms": 1000},
-                },
-            ]
+        levelang_mock.translate = _translate_mock(
+            SAMPLE_COMPARE_RESPONSES[0], SAMPLE_COMPARE_RESPONSES[2]
         )
-        from levelang_mcp.server import translate_compare
-
         result = await translate_compare(
             "Hello", "fra", levels=["beginner", "advanced"]
         )
@@ -377,112 +420,177 @@ class TestTranslateCompareTool:
         assert "Advanced" in result
         assert "Intermediate" not in result
         assert "Fluent" not in result
-        assert mock_client.translate.call_count == 2
+        assert levelang_mock.translate.await_count == 2
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_invalid_levels(self, mock_client):
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                    {"code": "intermediate", "display_name": "Intermediate"},
-                    {"code": "advanced", "display_name": "Advanced"},
-                ],
-                "moods": [],
-            }
+    async def test_translate_compare_single_level_skips_language_lookup(
+        self, levelang_mock
+    ):
+        levelang_mock.get_language = AsyncMock()
+        levelang_mock.translate = AsyncMock(return_value=SAMPLE_TRANSLATION_RESPONSE)
+        result = await translate_compare("Hello", "fra", levels=["beginner"])
+        levelang_mock.get_language.assert_not_called()
+        assert levelang_mock.translate.call_args.kwargs["level"] == "beginner"
+        assert "French" in result
+        assert "Bonjour le monde" in result
+
+    async def test_translate_compare_single_level_backend_rejects(
+        self, levelang_mock, post_request
+    ):
+        response = httpx.Response(
+            422, json={"detail": "Unknown level 'HSK1'"}, request=post_request
         )
-        from levelang_mcp.server import translate_compare
+        levelang_mock.translate = _async_raise(_status_error(response))
+        result = await translate_compare("Hello", "fra", levels=["HSK1"])
+        assert "Error: Invalid request: Unknown level 'HSK1'" in result
+
+    async def test_translate_compare_single_level_timeout(self, levelang_mock):
+        levelang_mock.translate = _async_raise(httpx.TimeoutException("timeout"))
+        result = await translate_compare("Hello", "fra", levels=["beginner"])
+        assert "Beginner" in result
+        assert "Error: Request timed out." in result
+        assert "language details" not in result
 
+    async def test_translate_compare_single_level_server_error(
+        self, levelang_mock, post_500
+    ):
+        levelang_mock.translate = _async_raise(_status_error(post_500))
+        result = await translate_compare("Hello", "fra", levels=["beginner"])
+        assert "Beginner" in result
+        assert "Error: Backend error (HTTP 500)" in result
+
+    async def test_translate_compare_single_level_null_metadata(self, levelang_mock):
+        levelang_mock.translate = AsyncMock(
+            return_value={"translation": "Bonjour", "metadata": None}
+        )
+        result = await translate_compare("Hello", "fra", levels=["beginner"])
+        assert "fra" in result
+        assert "Bonjour" in result
+
+    async def test_translate_compare_invalid_levels(self, levelang_mock):
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "intermediate", "advanced")
+        )
         result = await translate_compare("Hello", "fra", levels=["beginner", "HSK1"])
         assert "Invalid level(s): HSK1" in result
         assert "beginner" in result
         assert "intermediate" in result
         assert "advanced" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_none_levels_compares_all(self, mock_client):
+    async def test_translate_compare_none_levels_compares_all(self, levelang_mock):
         """Passing levels=None (the default) should compare all available levels."""
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                    {"code": "advanced", "display_name": "Advanced"},
-                ],
-                "moods": [],
-            }
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "advanced")
         )
-        mock_client.translate = AsyncMock(
-            side_effect=[
-                {"translation": "Bonjour", "transliteration": None, "metadata": {}},
-                {
-                    "translation": "Bonjour, comment allez-vous",
-                    "transliteration": None,
-                    "metadata": {},
-                },
-            ]
-        )
-        from levelang_mcp.server import translate_compare
-
+        levelang_mock.translate = _translate_mock(*SAMPLE_COMPARE_RESPONSES[:2])
         result = await translate_compare("Hello", "fra", levels=None)
         assert "Beginner" in result
         assert "Advanced" in result
-        assert mock_client.translate.call_count == 2
+        assert levelang_mock.translate.await_count == 2
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_passes_mode_through(self, mock_client):
+    async def test_translate_compare_passes_mode_through(self, levelang_mock):
         """Mode parameter should be passed to each translate call."""
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                ],
-                "moods": [],
-            }
-        )
-        mock_client.translate = AsyncMock(
+        levelang_mock.get_language = AsyncMock(return_value=_french_meta("beginner"))
+        levelang_mock.translate = AsyncMock(
             return_value={
                 "translation": "Bonjour",
                 "transliteration": None,
                 "metadata": {},
             }
         )
-        from levelang_mcp.server import translate_compare
-
         result = await translate_compare("Hello", "fra", mode="spoken")
-        call_kwargs = mock_client.translate.call_args.kwargs
+        call_kwargs = levelang_mock.translate.call_args.kwargs
         assert call_kwargs["mode"] == "spoken"
         assert "Mode: Spoken" in result
 
-    @patch("levelang_mcp.server.levelang")
-    async def test_translate_compare_without_mode(self, mock_client):
+    async def test_translate_compare_without_mode(self, levelang_mock):
         """Omitting mode should default to None (backward compat)."""
-        mock_client.get_language = AsyncMock(
-            return_value={
-                "name": "French",
-                "code": "fra",
-                "levels": [
-                    {"code": "beginner", "display_name": "Beginner"},
-                ],
-                "moods": [],
-            }
-        )
-        mock_client.translate = AsyncMock(
+        levelang_mock.get_language = AsyncMock(return_value=_french_meta("beginner"))
+        levelang_mock.translate = AsyncMock(
             return_value={
                 "translation": "Bonjour",
                 "transliteration": None,
                 "metadata": {},
             }
         )
-        from levelang_mcp.server import translate_compare
-
         result = await translate_compare("Hello", "fra")
-        call_kwargs = mock_client.translate.call_args.kwargs
+        call_kwargs = levelang_mock.translate.call_args.kwargs
         assert call_kwargs["mode"] is None
         # Mode should not appear in header when None
         assert "Mode:" not in result
+
+    async def test_translate_compare_bounds_concurrency(
+        self,
+        levelang_mock,
+        slow_translate: _ConcurrencyProbe,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """No more than translate_compare_concurrency translations run at once."""
+        monkeypatch.setattr(
+            "levelang_mcp.server._compare_semaphore", asyncio.Semaphore(2)
+        )
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "intermediate", "advanced", "fluent")
+        )
+        await translate_compare("Hello", "fra")
+        assert levelang_mock.translate.await_count == 4
+        assert slow_translate.peak == 2
+
+    async def test_translate_compare_bound_shared_across_calls(
+        self,
+        levelang_mock,
+        slow_translate: _ConcurrencyProbe,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Concurrent translate_compare calls draw from one semaphore."""
+        monkeypatch.setattr(
+            "levelang_mcp.server._compare_semaphore", asyncio.Semaphore(2)
+        )
+        levelang_mock.get_language = AsyncMock(
+            return_value=_french_meta("beginner", "advanced")
+        )
+        await asyncio.gather(
+            translate_compare("Hello", "fra"), translate_compare("Goodbye", "fra")
+        )
+        assert levelang_mock.translate.await_count == 4
+        assert slow_translate.peak == 2
+
+
+class TestClientReuse:
+    async def test_tool_calls_reuse_one_http_client(
+        self, backend: respx.MockRouter, new_http_clients: list[httpx.AsyncClient]
+    ):
+        translate_route = backend.post("/translate").mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
+        )
+        backend.get("/languages/details").mock(
+            return_value=json_response(SAMPLE_LANGUAGES_RESPONSE_JSON)
+        )
+        for _ in range(2):
+            await translate("Hello", "fra", "beginner")
+            await list_languages()
+        assert translate_route.call_count == 2
+        assert new_http_clients == []
+
+    async def test_translate_compare_reuses_one_http_client(
+        self, backend: respx.MockRouter, new_http_clients: list[httpx.AsyncClient]
+    ):
+        levels = ("beginner", "intermediate", "advanced", "fluent")
+        backend.get("/languages/fra").mock(
+            return_value=json_response(
+                orjson.dumps(_french_meta(*levels), default=dict)
+            )
+        )
+        translate_route = backend.post("/translate").mock(
+            return_value=json_response(SAMPLE_TRANSLATION_RESPONSE_JSON)
+        )
+        await translate_compare("Hello", "fra")
+        assert translate_route.call_count == len(levels)
+        assert new_http_clients == []
+
+
+class TestCompareLevelsPrompt:
+    def test_prompt_mentions_language(self):
+        assert "into German at all available levels" in compare_levels("German")
+
+    def test_prompt_is_memoized(self):
+        assert compare_levels("Italian") is compare_levels("Italian")